@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional
 
 class DeviceType(str, Enum):
@@ -121,6 +122,35 @@ OS_BROWSER_VERSIONS: Dict[str, Dict[str, Dict[str, int]]] = {
     }
 }
 
+# Device configs are fully determined by their arguments, so build each
+# distinct one once; typed keeps enum and plain-string callers apart
+@lru_cache(maxsize=64, typed=True)
+def _build_device_config(
+    device_type: str, browser_family: str, os_family: Optional[str]
+) -> Dict[str, Any]:
+    device_specs = DEVICE_SPECIFICATIONS[device_type]
+
+    # Validate and get compatible OS
+    if os_family and os_family not in device_specs["supported_os"]:
+        raise ValueError(f"OS {os_family} not supported for device type {device_type}")
+
+    os_family = os_family or device_specs["supported_os"][0]
+
+    # Get browser version constraints
+    browser_versions = OS_BROWSER_VERSIONS.get(os_family, {}).get(browser_family, {})
+
+    return {
+        "device_type": device_type,
+        "browser": {
+            "family": browser_family,
+            "min_version": browser_versions.get("min_version"),
+            "max_version": browser_versions.get("max_version")
+        },
+        "os": os_family,
+        "screen": device_specs["screen"],
+        "input_capabilities": device_specs["input_capabilities"]
+    }
+
 class DeviceProfileManager:
     """Manages device profiles and ensures configuration consistency"""
     
@@ -137,31 +167,12 @@ class DeviceProfileManager:
         Get a consistent device configuration based on specified parameters
         """
         device_type = device_type or self.default_device_type
-        device_specs = DEVICE_SPECIFICATIONS[device_type]
         
         # Default to Firefox if not specified
         browser_family = browser_family or BrowserFamily.FIREFOX
-        
-        # Validate and get compatible OS
-        if os_family and os_family not in device_specs["supported_os"]:
-            raise ValueError(f"OS {os_family} not supported for device type {device_type}")
-            
-        os_family = os_family or device_specs["supported_os"][0]
-        
-        # Get browser version constraints
-        browser_versions = OS_BROWSER_VERSIONS.get(os_family, {}).get(browser_family, {})
-        
-        return {
-            "device_type": device_type,
-            "browser": {
-                "family": browser_family,
-                "min_version": browser_versions.get("min_version"),
-                "max_version": browser_versions.get("max_version")
-            },
-            "os": os_family,
-            "screen": device_specs["screen"],
-            "input_capabilities": device_specs["input_capabilities"]
-        }
+
+        # Copy so callers can't alter the cached config
+        return dict(_build_device_config(device_type, browser_family, os_family))
 
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -59,6 +59,24 @@ class GeolocationProfiles:
     def __init__(self):
         self.config_path = Path("config/geolocation_profiles.json")
         self.custom_profiles = self._load_custom_profiles()
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Index city names and weights by timezone for weighted selection"""
+        self._all_cities = (
+            list(self.CITY_PROFILES),
+            [profile["weight"] for profile in self.CITY_PROFILES.values()]
+        )
+        # Proxy region per city, e.g. "Europe/London" -> "EUROPE"
+        self._city_regions = {
+            name: profile["timezone"].partition("/")[0].upper()
+            for name, profile in self.CITY_PROFILES.items()
+        }
+        self._cities_by_timezone: Dict[str, Tuple[List[str], List[float]]] = {}
+        for name, profile in self.CITY_PROFILES.items():
+            names, weights = self._cities_by_timezone.setdefault(profile["timezone"], ([], []))
+            names.append(name)
+            weights.append(profile["weight"])
 
     def _load_custom_profiles(self) -> Dict[str, Dict[str, Any]]:
         """Load custom profiles from config file"""
@@ -70,34 +88,37 @@ class GeolocationProfiles:
             logger.warning(f"Failed to load custom profiles: {e}")
         return {}
 
-    def get_random_location(self, timezone: Optional[str] = None) -> Tuple[GeoLocation, str, str]:
-        """Get random location with matching timezone and locale"""
+    def get_random_location(self, timezone: Optional[str] = None) -> Tuple[GeoLocation, str, str, str]:
+        """Get random location with matching timezone, locale and proxy region"""
+        candidates = self._all_cities
         if timezone:
-            # Filter profiles matching timezone
-            matching_profiles = {
-                name: profile for name, profile in self.CITY_PROFILES.items()
-                if profile["timezone"] == timezone
-            }
-            if not matching_profiles:
+            # Profiles matching timezone
+            candidates = self._cities_by_timezone.get(timezone)
+            if not candidates:
                 logger.warning(f"No profiles found for timezone {timezone}, using random")
-                matching_profiles = self.CITY_PROFILES
-        else:
-            matching_profiles = self.CITY_PROFILES
+                candidates = self._all_cities
 
         # Select random profile based on weights
-        weights = [profile["weight"] for profile in matching_profiles.values()]
-        profile_name = random.choices(list(matching_profiles.keys()), weights=weights)[0]
-        profile = matching_profiles[profile_name]
+        names, weights = candidates
+        profile_name = random.choices(names, weights=weights)[0]
+        profile = self.CITY_PROFILES[profile_name]
 
-        # Add small random offset to prevent fingerprinting
+        # Add small random offset to prevent fingerprinting, snapped to a
+        # 0.005 degree grid so the values stay short and plausible
         coords = profile["coords"]
+        uniform = random.uniform
         randomized_location = GeoLocation(
-            latitude=coords.latitude + random.uniform(-0.01, 0.01),
-            longitude=coords.longitude + random.uniform(-0.01, 0.01),
+            latitude=round((coords.latitude + uniform(-0.05, 0.05)) * 200) / 200,
+            longitude=round((coords.longitude + uniform(-0.05, 0.05)) * 200) / 200,
             accuracy=random.randint(1, 100)
         )
 
-        return randomized_location, profile["timezone"], profile["locale"]
+        return (
+            randomized_location,
+            profile["timezone"],
+            profile["locale"],
+            self._city_regions[profile_name]
+        )
 
     def add_custom_profile(self, name: str, profile: Dict[str, Any]) -> None:
         """Add custom geolocation profile"""
@@ -146,7 +146,7 @@ class HeaderRuleManager:
             # Set User-Agent
             base_headers['User-Agent'] = user_agent
             
-            logger.debug(f"Generated headers for {browser.value} v{version}")
+            logger.debug("Generated headers for %s v%s", browser.value, version)
             return base_headers
 
         except Exception as e:
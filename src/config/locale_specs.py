@@ -122,6 +122,19 @@ class LocaleManager:
 
     def __init__(self):
         self._validate_weights()
+        # Selection inputs and the static per-locale fields, built once
+        self._locales = list(self.LOCALE_SPECS.values())
+        self._weights = [locale.weight for locale in self._locales]
+        self._locale_fields = {
+            code: {
+                "locale": locale.code,
+                "accept_language": locale.accept_language,
+                "time_zone": locale.time_zone,
+                "date_format": locale.date_format,
+                "number_format": locale.number_format,
+            }
+            for code, locale in self.LOCALE_SPECS.items()
+        }
 
     def _validate_weights(self):
         """Validate that locale weights sum to approximately 1"""
@@ -138,10 +151,9 @@ class LocaleManager:
     def get_locale(self, browser: str, device_type: str) -> LocaleConfig:
         """Get appropriate locale based on browser and device type"""
         # Use weighted random selection
-        weights = [locale.weight for locale in self.LOCALE_SPECS.values()]
         selected_locale = random.choices(
-            list(self.LOCALE_SPECS.values()),
-            weights=weights,
+            self._locales,
+            weights=self._weights,
             k=1
         )[0]
         return selected_locale
@@ -183,10 +195,6 @@ class LocaleManager:
         http_version = self.get_http_version(browser, device_type)
 
         return {
-            "locale": locale.code,
-            "accept_language": locale.accept_language,
-            "time_zone": locale.time_zone,
-            "date_format": locale.date_format,
-            "number_format": locale.number_format,
+            **self._locale_fields[locale.code],
             "http_version": http_version.value
         } 
\ No newline at end of file
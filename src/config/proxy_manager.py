@@ -1,5 +1,5 @@
-from typing import Dict, Any, Optional, List, Protocol
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Protocol, Tuple
+from dataclasses import dataclass, replace
 import aiohttp
 import logging
 from enum import Enum
@@ -125,6 +125,15 @@ class WorkingProxyAdapter(ProxyAdapter):
 
 
 class ProxyManager:
+    # Proxy lists per set of source files (resolved paths), with the file
+    # mtimes they were read at, so files are only read again once they
+    # change or appear. Each manager gets its own copies of the entries,
+    # since validation updates them, and keeps its own current proxy.
+    _loaded: Dict[
+        Tuple[Path, ...],
+        Tuple[Tuple[Optional[int], ...], List[ProxyConfig], List[ProxyConfig]],
+    ] = {}
+
     def __init__(
         self,
         proxy_file: str = "config/proxies.json",
@@ -145,9 +154,30 @@ class ProxyManager:
         self.working_proxies: List[ProxyConfig] = []
         self.current_proxy = None
 
-        self._load_all_proxies()
+        sources = (self.proxy_file, self.raw_proxy_file, self.working_proxies_file)
+        key = tuple(path.resolve() for path in sources)
+        mtimes = tuple(self._mtime(path) for path in sources)
+        loaded = self._loaded.get(key)
+        if loaded is None or loaded[0] != mtimes:
+            self._load_all_proxies()
+            self._loaded[key] = (mtimes, self._copy(self.proxies), self._copy(self.working_proxies))
+        else:
+            self.proxies = self._copy(loaded[1])
+            self.working_proxies = self._drop_expired(self._copy(loaded[2]))
         self._display_proxy_status()
 
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        """Modification time of path in ns, or None if it doesn't exist"""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _copy(proxies: List[ProxyConfig]) -> List[ProxyConfig]:
+        return [replace(proxy) for proxy in proxies]
+
     def _load_all_proxies(self) -> None:
         """Load proxies from all sources"""
         # Load raw proxies
@@ -173,19 +203,24 @@ class ProxyManager:
             console.print(
                 f"[blue]Loading working proxies from {self.working_proxies_file}[/blue]"
             )
-            working_proxies = self._load_from_file(self.working_proxies_file, "working")
-            # Filter out expired proxies
-            now = datetime.now()
-            working_proxies = [
-                p
-                for p in working_proxies
-                if p.last_checked and now - p.last_checked < timedelta(hours=1)
-            ]
+            working_proxies = self._drop_expired(
+                self._load_from_file(self.working_proxies_file, "working")
+            )
             self.working_proxies.extend(working_proxies)
             console.print(
                 f"[green]Loaded {len(working_proxies)} working proxies[/green]"
             )
 
+    @staticmethod
+    def _drop_expired(proxies: List[ProxyConfig]) -> List[ProxyConfig]:
+        """Keep only proxies checked within the last hour"""
+        now = datetime.now()
+        return [
+            p
+            for p in proxies
+            if p.last_checked and now - p.last_checked < timedelta(hours=1)
+        ]
+
     def _load_from_file(self, file_path: Path, adapter_type: str) -> List[ProxyConfig]:
         """Load proxies from a file using specified adapter"""
         try:
@@ -252,7 +287,7 @@ class ProxyManager:
                     )
                     return proxy
             except Exception as e:
-                logger.debug(f"Failed to validate proxy {proxy.server}: {e}")
+                logger.debug("Failed to validate proxy %s: %s", proxy.server, e)
                 continue
 
         logger.warning("No working proxy found")
@@ -285,15 +320,16 @@ class ProxyManager:
                         return True
 
         except Exception as e:
-            logger.debug(f"Proxy validation failed: {e}")
+            logger.debug("Proxy validation failed: %s", e)
         return False
 
     def get_proxy_config(self) -> Optional[Dict[str, Any]]:
         """Get current proxy configuration for Playwright"""
-        if self.current_proxy:
+        proxy = self.current_proxy
+        if proxy:
             return {
-                "server": f"{self.current_proxy.protocol.value}://{self.current_proxy.server}",
-                "username": self.current_proxy.username,
-                "password": self.current_proxy.password,
+                "server": f"{proxy.protocol.value}://{proxy.server}",
+                "username": proxy.username,
+                "password": proxy.password,
             }
         return None
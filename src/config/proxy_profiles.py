@@ -33,6 +33,9 @@ class ProxyProfiles:
     def __init__(self):
         self.config_path = Path("config/proxy_profiles.json")
         self.proxies = self._load_proxies()
+        # Region names and weights for weighted selection, built once
+        self._region_names = list(self.proxies["regions"])
+        self._region_weights = [r["weight"] for r in self.proxies["regions"].values()]
         
     def _load_proxies(self) -> Dict[str, Dict[str, Any]]:
         """Load proxy list from config file"""
@@ -78,8 +81,7 @@ class ProxyProfiles:
             proxy_list = self.proxies["regions"][region]["proxies"]
         else:
             # Select random region based on weights
-            weights = [r["weight"] for r in self.proxies["regions"].values()]
-            region = random.choices(list(self.proxies["regions"].keys()), weights=weights)[0]
+            region = random.choices(self._region_names, weights=self._region_weights)[0]
             proxy_list = self.proxies["regions"][region]["proxies"]
 
         proxy_data = random.choice(proxy_list)
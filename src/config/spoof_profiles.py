@@ -1,12 +1,12 @@
-from typing import Dict, Any, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 from enum import Enum
+from functools import lru_cache
 import json
 from pathlib import Path
 import random
 import logging
+import zoneinfo
 from dataclasses import dataclass
-import pytz
-from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,90 @@ TIMEZONE_COORDINATES = {
     "Asia/Hong_Kong": (22.3193, 114.1694)
 }
 
+# Selection weights per timezone, split into parallel lists once
+_TIMEZONE_WEIGHTS = {
+    "America/New_York": 0.2,
+    "Europe/London": 0.15,
+    "Asia/Tokyo": 0.1,
+    "Europe/Paris": 0.1,
+    "Asia/Singapore": 0.05,
+    "Australia/Sydney": 0.05,
+    "Asia/Dubai": 0.05,
+    "Europe/Berlin": 0.05,
+    "Asia/Seoul": 0.05,
+    "Europe/Moscow": 0.05,
+    "Asia/Shanghai": 0.05,
+    "Europe/Amsterdam": 0.05,
+    "Asia/Hong_Kong": 0.05
+}
+_TIMEZONE_IDS = list(_TIMEZONE_WEIGHTS)
+_TIMEZONE_WEIGHT_VALUES = list(_TIMEZONE_WEIGHTS.values())
+
+# Locales matching each timezone region
+_REGION_LOCALES = {
+    "America": ["en-US", "en-CA", "es-MX"],
+    "Europe": ["en-GB", "fr-FR", "de-DE", "es-ES", "nl-NL", "ru-RU"],
+    "Asia": ["ja-JP", "zh-CN", "ko-KR", "zh-TW", "zh-HK", "ar-AE"],
+    "Australia": ["en-AU"]
+}
+_DEFAULT_LOCALES = ["en-US"]
+
+# Audio config fields: expected type and value check
+_AUDIO_SCHEMA: Dict[str, Tuple[type, Callable[[Any], bool]]] = {
+    "sample_rate": (int, lambda v: v > 0),
+    "channel_count": (int, lambda v: v > 0),
+}
+
+
+@lru_cache(maxsize=None)
+def _available_timezones() -> frozenset:
+    """Known timezone ids, scanned once on first validation"""
+    return frozenset(zoneinfo.available_timezones())
+
+
+@lru_cache(maxsize=512)
+def _validated_tz(tz_id: str) -> bool:
+    """Raise if tz_id is not a known timezone, caching valid ids"""
+    known = _available_timezones()
+    if known:
+        if tz_id not in known:
+            raise zoneinfo.ZoneInfoNotFoundError(f"No time zone found with key {tz_id}")
+        return True
+
+    # No tzdata index on this system, fall back to loading the zone
+    zoneinfo.ZoneInfo(tz_id)
+    return True
+
+
+def validate_timezone_config(config: Dict[str, Any]) -> None:
+    """Validate timezone configuration"""
+    if "timezone_id" in config:
+        try:
+            _validated_tz(config["timezone_id"])
+        except Exception as e:
+            raise ValueError(f"Invalid timezone: {e}")
+
+
+def validate_audio_config(config: Dict[str, Any]) -> None:
+    """Validate audio configuration"""
+    for key, (expected_type, check) in _AUDIO_SCHEMA.items():
+        if key in config:
+            value = config[key]
+            if not isinstance(value, expected_type) or not check(value):
+                raise ValueError(f"Invalid {key.replace('_', ' ')}")
+
+
+def validate_profile(profile: Dict[str, Any]) -> None:
+    """Validate the timezone and audio sections of a spoofing profile"""
+    if not isinstance(profile, dict):
+        raise ValueError("Profile must be a mapping")
+    # Configs drawn from profiles index both sections directly
+    for section in ("timezone", "audio"):
+        if not isinstance(profile.get(section), dict):
+            raise ValueError(f"Missing or invalid {section} section")
+    validate_timezone_config(profile["timezone"])
+    validate_audio_config(profile["audio"])
+
 class DeviceType(Enum):
     DESKTOP = "desktop"
     MOBILE = "mobile"
@@ -55,36 +139,14 @@ class TimezoneProfile:
     @classmethod
     def get_random(cls) -> 'TimezoneProfile':
         # Get random timezone from a weighted list
-        timezone_weights = {
-            "America/New_York": 0.2,
-            "Europe/London": 0.15,
-            "Asia/Tokyo": 0.1,
-            "Europe/Paris": 0.1,
-            "Asia/Singapore": 0.05,
-            "Australia/Sydney": 0.05,
-            "Asia/Dubai": 0.05,
-            "Europe/Berlin": 0.05,
-            "Asia/Seoul": 0.05,
-            "Europe/Moscow": 0.05,
-            "Asia/Shanghai": 0.05,
-            "Europe/Amsterdam": 0.05,
-            "Asia/Hong_Kong": 0.05
-        }
-        
         timezone_id = random.choices(
-            list(timezone_weights.keys()),
-            weights=list(timezone_weights.values())
+            _TIMEZONE_IDS,
+            weights=_TIMEZONE_WEIGHT_VALUES
         )[0]
         
         # Match locale to timezone region
-        locale_map = {
-            "America": ["en-US", "en-CA", "es-MX"],
-            "Europe": ["en-GB", "fr-FR", "de-DE", "es-ES", "nl-NL", "ru-RU"],
-            "Asia": ["ja-JP", "zh-CN", "ko-KR", "zh-TW", "zh-HK", "ar-AE"],
-            "Australia": ["en-AU"]
-        }
         region = timezone_id.split('/')[0]
-        locale = random.choice(locale_map.get(region, ["en-US"]))
+        locale = random.choice(_REGION_LOCALES.get(region, _DEFAULT_LOCALES))
         
         # Get base coordinates for timezone
         base_lat, base_lng = TIMEZONE_COORDINATES[timezone_id]
@@ -108,14 +170,41 @@ class SpoofingProfiles:
         
     def _load_profiles(self) -> Dict[str, List[Dict[str, Any]]]:
         """Load profiles from config file or generate defaults"""
+        profiles = None
         try:
             if self.config_path.exists():
                 with open(self.config_path) as f:
-                    return json.load(f)
+                    profiles = self._drop_invalid_profiles(json.load(f))
         except Exception as e:
             logger.warning(f"Failed to load profiles: {e}")
-            
-        return self._generate_default_profiles()
+
+        if profiles is None:
+            return self._generate_default_profiles()
+        if not profiles:
+            # Regenerating defaults here would overwrite the user's file
+            raise ValueError(f"No valid spoofing profiles in {self.config_path}")
+        return profiles
+
+    def _drop_invalid_profiles(
+        self, profiles: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Validate loaded profiles once, skipping any that are malformed"""
+        valid_profiles = {}
+        for device_type, device_profiles in profiles.items():
+            valid = []
+            for profile in device_profiles:
+                try:
+                    validate_profile(profile)
+                except ValueError as e:
+                    name = profile.get("name") if isinstance(profile, dict) else None
+                    logger.warning(
+                        "Skipping invalid %s profile %s: %s", device_type, name, e
+                    )
+                    continue
+                valid.append(profile)
+            if valid:
+                valid_profiles[device_type] = valid
+        return valid_profiles
         
     def _generate_default_profiles(self) -> Dict[str, List[Dict[str, Any]]]:
         """Generate diverse default profiles"""
@@ -176,7 +265,8 @@ class SpoofingProfiles:
         """Add new profile"""
         if device_type not in self.profiles:
             raise ValueError(f"Invalid device type: {device_type}")
-            
+
+        validate_profile(profile)
         self.profiles[device_type].append(profile)
         self._save_profiles(self.profiles)
         
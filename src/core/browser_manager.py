@@ -1,29 +1,224 @@
 from typing import Optional, Dict, Any
+import contextlib
+import functools
+import secrets
 from playwright.async_api import async_playwright, Browser, Page
-from browserforge.injectors.playwright import AsyncNewContext
 from .fingerprint_generator import AnonymousFingerprint
-from ..utils.logger import setup_logger
-from ..utils.display import show_active_config, get_js_config
-from rich.console import Console
-from .network_handler import NetworkRequestHandler
+from .browser_pool import BrowserPool
+from ..utils.js_minifier import minify_js
 import logging
-from .media_mock_handler import MediaMockHandler
-from .context_spoofer import ContextSpoofer
 
-console = Console()
 logger = logging.getLogger(__name__)
 
+# Config display template, minified once at import. The config JSON and the
+# name of the config binding are spliced in between its three parts.
+_CONFIG_DISPLAY_JS = """
+const configDiv = document.createElement('div');
+configDiv.id = 'browser-config';
+
+const styles = document.createElement('style');
+styles.textContent = `
+    #browser-config {
+        position: fixed;
+        top: 10px;
+        right: 10px;
+        font-family: monospace;
+        font-size: 11px;
+        z-index: 9999;
+        user-select: none;
+        background: #000;
+        color: #fff;
+        border-radius: 3px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.3);
+        opacity: 0.85;
+        padding: 4px 8px;
+        width: max-content;
+    }
+    .config-section {
+        margin: 4px 0;
+        padding: 2px 0;
+        background: #000;
+    }
+    .config-section:last-child {
+    }
+    .config-row {
+        display: block;
+        line-height: 15px;
+        white-space: nowrap;
+        margin: 8px auto;
+        padding: 8px 16px;
+        background-color: #000;
+    }
+    .config-label {
+        color: #888;
+        display: inline-block;
+        min-width: 20px;
+    }
+    .config-separator {
+        color: #888;
+        margin: 0 4px;
+    }
+    .config-value {
+        color: #2196F3;
+    }
+    .config-value.os { color: #2196F3; }
+    .config-value.hw { color: #FFC107; }
+    .config-value.screen { color: #E91E63; }
+    #toggle-button {
+        position: fixed;
+        top: 10px;
+        right: 10px;
+        background: #000;
+        color: #4CAF50;
+        border: none;
+        border-radius: 3px;
+        padding: 3px 6px;
+        cursor: pointer;
+        font-family: monospace;
+        font-size: 11px;
+        opacity: 0.85;
+        display: none;
+        z-index: 9999;
+    }
+    #config-header {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-top: 8px;
+        margin-bottom: 4px;
+        padding-bottom: 2px;
+        background: #000;
+    }
+    #minimize-button {
+        color: #888;
+        cursor: pointer;
+        padding: 0 4px;
+    }
+    .hidden {
+        display: none !important;
+    }
+`;
+document.head.appendChild(styles);
+
+const config = %s;
+const configBinding = %s;
+
+// Main config view with all information
+configDiv.innerHTML = `
+    <div id="config-header">
+        <span>
+            <span style="color:#4CAF50" data-compact="id">${config.compact.id}</span>
+            <span class="config-value os" data-compact="os">${config.compact.os}</span>
+            <span class="config-value hw" data-compact="hw">${config.compact.hw}</span>
+            <span class="config-value screen" data-compact="res">${config.compact.res}</span>
+        </span>
+        <span id="minimize-button">▼</span>
+    </div>
+    ${Object.entries(config.detailed).map(([section, items]) => `
+        <div class="config-section">
+            ${Object.entries(items).map(([label, value]) => `
+                <div class="config-row">
+                    <span class="config-label">${label}</span>
+                    <span class="config-separator">:</span>
+                    <span class="config-value">${value}</span>
+                </div>
+            `).join('')}
+        </div>
+    `).join('')}
+`;
+
+// Create toggle button (initially hidden)
+const toggleButton = document.createElement('button');
+toggleButton.id = 'toggle-button';
+toggleButton.textContent = '▲ Show';
+toggleButton.style.display = 'none';
+document.body.appendChild(toggleButton);
+
+// Add toggle functionality
+const minimizeButton = configDiv.querySelector('#minimize-button');
+let isMinimized = false;
+
+function toggleView() {
+    isMinimized = !isMinimized;
+    if (isMinimized) {
+        configDiv.classList.add('hidden');
+        toggleButton.style.display = 'block';
+        toggleButton.textContent = '▲ Show';
+    } else {
+        configDiv.classList.remove('hidden');
+        toggleButton.style.display = 'none';
+        minimizeButton.textContent = '▼';
+        // Pull the latest config from Python when the panel is shown again
+        const getConfig = window[configBinding];
+        if (getConfig) {
+            getConfig().then(cfg => cfg && window.__setBrowserConfig(cfg));
+        }
+    }
+}
+
+minimizeButton.onclick = toggleView;
+toggleButton.onclick = toggleView;
+
+document.body.appendChild(configDiv);
+
+// Cache value nodes once so live updates only patch textContent
+const compactNodes = Array.from(configDiv.querySelectorAll('[data-compact]'));
+const valueNodes = Array.from(configDiv.querySelectorAll('.config-row .config-value'));
+
+window.__setBrowserConfig = (cfg) => {
+    compactNodes.forEach(node => {
+        node.textContent = cfg.compact[node.dataset.compact];
+    });
+    const values = Object.values(cfg.detailed).flatMap(items => Object.values(items));
+    values.forEach((value, i) => {
+        if (valueNodes[i]) valueNodes[i].textContent = value;
+    });
+    return true;
+};
+"""
+_CONFIG_DISPLAY_JS_HEAD, _CONFIG_DISPLAY_JS_MID, _CONFIG_DISPLAY_JS_TAIL = (
+    minify_js(_CONFIG_DISPLAY_JS).split("%s")
+)
+
 
 class AnonymousBrowser:
-    def __init__(self) -> None:
+    def __init__(self, browser_pool: Optional[BrowserPool] = None) -> None:
         self.fingerprint_generator = AnonymousFingerprint()
+        self.browser_pool = browser_pool
+        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context = None
         self.page: Optional[Page] = None
         self.current_config: Optional[Dict[str, Any]] = None
-        self.network_handler = NetworkRequestHandler()
-        self.media_mock_handler = MediaMockHandler()
-        self.context_spoofer = ContextSpoofer()
+        # browserforge Fingerprint the display panel is built from
+        self.fingerprint: Optional[Any] = None
+        self._display_sig: Optional[int] = None
+        # Pages could probe for a fixed binding name, so each browser gets
+        # a random one, exposed only once the display is injected
+        self._config_binding = f"_{secrets.token_hex(8)}"
+        self._config_binding_exposed = False
+
+    # Handlers, the console and the display helpers are imported and built
+    # on first use so that importing this module stays cheap.
+    @functools.cached_property
+    def console(self):
+        from rich.console import Console
+        return Console()
+
+    @functools.cached_property
+    def network_handler(self):
+        from .network_handler import NetworkRequestHandler
+        return NetworkRequestHandler()
+
+    @functools.cached_property
+    def media_mock_handler(self):
+        from .media_mock_handler import MediaMockHandler
+        return MediaMockHandler()
+
+    @functools.cached_property
+    def context_spoofer(self):
+        from .context_spoofer import ContextSpoofer
+        return ContextSpoofer()
 
     async def launch(self) -> None:
         """Launch browser with network handling"""
@@ -31,19 +226,38 @@ class AnonymousBrowser:
             # Await the generate coroutine
             config = await self.fingerprint_generator.generate()
             self.current_config = config["fingerprint"]
+            self.fingerprint = config.get("browserforge_fingerprint")
 
-            console.print("\n[bold yellow]Launching browser with configuration:[/]")
+            self.console.print("\n[bold yellow]Launching browser with configuration:[/]")
             self._show_active_config()
 
-            playwright = await async_playwright().start()
-            self.browser = await playwright.firefox.launch(headless=False)
+            if self.browser_pool:
+                # Reuse an already running browser instead of paying startup
+                self.browser = await self.browser_pool.acquire()
+            else:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.firefox.launch(headless=False)
+
+            # Spoofer options (e.g. proxy) have to be set at creation time
+            context_options = await self.context_spoofer.get_context_options()
 
             # Create context with network handling
+            # Headers are applied natively by the browser rather than
+            # rewritten per request in a route handler. A spoofed locale
+            # already sets Accept-Language, and a header from a separate
+            # locale draw would contradict navigator.language.
+            locale_info = config.get("locale_info") or {}
+            extra_headers = {}
+            if "locale" not in context_options and locale_info.get("accept_language"):
+                extra_headers["Accept-Language"] = locale_info["accept_language"]
+
             self.context = await self.browser.new_context(
                 viewport=self.current_config["viewport"],
-                user_agent=self.current_config["userAgent"]
+                user_agent=self.current_config["userAgent"],
+                extra_http_headers=extra_headers,
+                **context_options
             )
-            
+
             # Setup network monitoring
             await self.network_handler.setup_request_interception(self.context)
             
@@ -59,7 +273,7 @@ class AnonymousBrowser:
             await self.media_mock_handler.setup_mocks(self.context)
             
             # Setup context spoofing
-            await self.context_spoofer.setup_spoofing(self.context)
+            await self.context_spoofer.setup_spoofing(self.context, context_options)
             
             logger.info("Browser launched with network handling enabled")
 
@@ -70,8 +284,8 @@ class AnonymousBrowser:
     def _show_active_config(self) -> None:
         """Show active browser configuration"""
         if self.current_config:
-            console.print(f"User Agent: {self.current_config.get('userAgent', 'N/A')}")
-            console.print(f"Viewport: {self.current_config.get('viewport', 'N/A')}")
+            logger.info("User Agent: %s", self.current_config.get("userAgent", "N/A"))
+            logger.info("Viewport: %s", self.current_config.get("viewport", "N/A"))
 
     def _setup_default_handlers(self) -> None:
         """Setup default network handlers"""
@@ -97,182 +311,92 @@ class AnonymousBrowser:
 
     async def _handle_request(self, request) -> None:
         """Log network requests"""
-        console.print(f"[dim blue]Request:[/] {request.method} {request.url}")
+        logger.debug("REQ %s %s", request.method, request.url)
 
     async def _handle_response(self, response) -> None:
         """Log network responses"""
-        status = response.status
-        color = "green" if 200 <= status < 300 else "red"
-        console.print(f"[{color}]Response:[/] {status} {response.url}")
+        logger.debug("RES %s %s", response.status, response.url)
 
     def _log_api_request(self, request) -> Optional[Dict[str, Any]]:
         """Log API requests"""
-        console.print(f"[yellow]API Request:[/] {request.method} {request.url}")
+        logger.debug("API %s %s", request.method, request.url)
         return None
 
     async def inject_config_display(self) -> None:
         """Inject configuration display with all info and toggle button"""
-        if self.page and self.current_config:
-            js_code = """
-            const configDiv = document.createElement('div');
-            configDiv.id = 'browser-config';
-            
-            const styles = document.createElement('style');
-            styles.textContent = `
-                #browser-config {
-                    position: fixed;
-                    top: 10px;
-                    right: 10px;
-                    font-family: monospace;
-                    font-size: 11px;
-                    z-index: 9999;
-                    user-select: none;
-                    background: #000;
-                    color: #fff;
-                    border-radius: 3px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.3);
-                    opacity: 0.85;
-                    padding: 4px 8px;
-                    width: max-content;
-                }
-                .config-section {
-                    margin: 4px 0;
-                    padding: 2px 0;
-                    background: #000;
-                }
-                .config-section:last-child {
-                }
-                .config-row {
-                    display: block;
-                    line-height: 15px;
-                    white-space: nowrap;
-                    margin: 8px auto;
-                    padding: 8px 16px;
-                    background-color: #000;
-                }
-                .config-label {
-                    color: #888;
-                    display: inline-block;
-                    min-width: 20px;
-                }
-                .config-separator {
-                    color: #888;
-                    margin: 0 4px;
-                }
-                .config-value {
-                    color: #2196F3;
-                }
-                .config-value.os { color: #2196F3; }
-                .config-value.hw { color: #FFC107; }
-                .config-value.screen { color: #E91E63; }
-                #toggle-button {
-                    position: fixed;
-                    top: 10px;
-                    right: 10px;
-                    background: #000;
-                    color: #4CAF50;
-                    border: none;
-                    border-radius: 3px;
-                    padding: 3px 6px;
-                    cursor: pointer;
-                    font-family: monospace;
-                    font-size: 11px;
-                    opacity: 0.85;
-                    display: none;
-                    z-index: 9999;
-                }
-                #config-header {
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    margin-top: 8px;
-                    margin-bottom: 4px;
-                    padding-bottom: 2px;
-                    background: #000;
-                }
-                #minimize-button {
-                    color: #888;
-                    cursor: pointer;
-                    padding: 0 4px;
-                }
-                .hidden {
-                    display: none !important;
-                }
-            `;
-            document.head.appendChild(styles);
-            
-            const config = %s;
-            
-            // Main config view with all information
-            configDiv.innerHTML = `
-                <div id="config-header">
-                    <span>
-                        <span style="color:#4CAF50">${config.compact.id}</span>
-                        <span class="config-value os">${config.compact.os}</span>
-                        <span class="config-value hw">${config.compact.hw}</span>
-                        <span class="config-value screen">${config.compact.res}</span>
-                    </span>
-                    <span id="minimize-button">▼</span>
-                </div>
-                ${Object.entries(config.detailed).map(([section, items]) => `
-                    <div class="config-section">
-                        ${Object.entries(items).map(([label, value]) => `
-                            <div class="config-row">
-                                <span class="config-label">${label}</span>
-                                <span class="config-separator">:</span>
-                                <span class="config-value">${value}</span>
-                            </div>
-                        `).join('')}
-                    </div>
-                `).join('')}
-            `;
-            
-            // Create toggle button (initially hidden)
-            const toggleButton = document.createElement('button');
-            toggleButton.id = 'toggle-button';
-            toggleButton.textContent = '▲ Show';
-            toggleButton.style.display = 'none';
-            document.body.appendChild(toggleButton);
-            
-            // Add toggle functionality
-            const minimizeButton = configDiv.querySelector('#minimize-button');
-            let isMinimized = false;
-            
-            function toggleView() {
-                isMinimized = !isMinimized;
-                if (isMinimized) {
-                    configDiv.classList.add('hidden');
-                    toggleButton.style.display = 'block';
-                    toggleButton.textContent = '▲ Show';
-                } else {
-                    configDiv.classList.remove('hidden');
-                    toggleButton.style.display = 'none';
-                    minimizeButton.textContent = '▼';
-                }
-            }
-            
-            minimizeButton.onclick = toggleView;
-            toggleButton.onclick = toggleView;
-            
-            document.body.appendChild(configDiv);
-            """ % get_js_config(
-                self.current_config
+        if self.page and self.fingerprint:
+            from ..utils.display import get_js_config
+            config_js = get_js_config(self.fingerprint)
+            sig = hash(config_js)
+
+            # Same config already shown on this page, skip the full injection
+            if sig == self._display_sig and await self.page.evaluate(
+                "!!document.getElementById('browser-config')"
+            ):
+                return
+
+            await self.page.evaluate(
+                _CONFIG_DISPLAY_JS_HEAD + config_js
+                + _CONFIG_DISPLAY_JS_MID + f'"{self._config_binding}"'
+                + _CONFIG_DISPLAY_JS_TAIL
             )
+            self._display_sig = sig
 
-            await self.page.evaluate(js_code)
+            if not self._config_binding_exposed:
+                # Let the injected display pull the current config on demand
+                await self.context.expose_binding(
+                    self._config_binding, self._get_display_config
+                )
+                self._config_binding_exposed = True
         else:
-            logger.warning("Cannot inject config display: page or config not available")
+            logger.warning("Cannot inject config display: page or fingerprint not available")
+
+    def _get_display_config(self, source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Binding callback returning the display config for the current fingerprint"""
+        if not self.fingerprint:
+            return None
+        from ..utils.display import format_fingerprint_for_display
+        return format_fingerprint_for_display(self.fingerprint)
+
+    async def update_config_display(self) -> None:
+        """Patch the injected configuration display in place after a config change"""
+        if not (self.page and self.fingerprint):
+            logger.warning("Cannot update config display: page or fingerprint not available")
+            return
+
+        from ..utils.display import format_fingerprint_for_display
+
+        updated = await self.page.evaluate(
+            "cfg => window.__setBrowserConfig ? window.__setBrowserConfig(cfg) : false",
+            format_fingerprint_for_display(self.fingerprint)
+        )
+        if not updated:
+            # Display not injected on this page yet, fall back to a full injection
+            await self.inject_config_display()
 
     async def close(self) -> None:
         """Close all browser resources"""
+        # Close each handle independently so one failure doesn't leak the rest
         if self.page:
-            await self.page.close()
+            with contextlib.suppress(Exception):
+                await self.page.close()
         if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-            await self.browser.close()
-
-    async def _inject_evasion_scripts(self) -> None:
-        # Implementation of _inject_evasion_scripts method
-        pass
+            with contextlib.suppress(Exception):
+                await self.context.close()
+        if self.browser and self.browser_pool:
+            await self.browser_pool.release(self.browser)
+        elif self.browser:
+            with contextlib.suppress(Exception):
+                await self.browser.close()
+        if self.playwright:
+            with contextlib.suppress(Exception):
+                await self.playwright.stop()
+        self.fingerprint_generator.close()
+
+        # Reset state so the instance can be launched again
+        self.page = None
+        self.context = None
+        self.browser = None
+        self.playwright = None
+        self._display_sig = None
+        self._config_binding_exposed = False
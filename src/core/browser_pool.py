@@ -0,0 +1,90 @@
+from typing import List, Optional
+import asyncio
+import contextlib
+import logging
+from playwright.async_api import async_playwright, Browser
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """Keep a few Firefox instances launched ahead of time"""
+
+    def __init__(self, size: int = 2, headless: bool = False) -> None:
+        self.size = size
+        self.headless = headless
+        self.playwright = None
+        self._idle: "asyncio.Queue[Browser]" = asyncio.Queue(maxsize=size)
+        self._filler: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the shared Playwright driver and begin pre-launching browsers"""
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        self._refill()
+
+    def _refill(self) -> None:
+        """Top the pool up in the background if no fill is already running"""
+        if self._filler is None or self._filler.done():
+            self._filler = asyncio.create_task(self._fill())
+
+    async def _launch(self) -> Browser:
+        return await self.playwright.firefox.launch(headless=self.headless)
+
+    async def _fill(self) -> None:
+        try:
+            while not self._idle.full():
+                browser = await self._launch()
+                try:
+                    self._idle.put_nowait(browser)
+                except asyncio.QueueFull:
+                    # A released browser took the slot while we were launching
+                    await browser.close()
+        except Exception as e:
+            logger.error("Failed to pre-launch browser: %s", e)
+
+    async def acquire(self) -> Browser:
+        """Hand out a pre-launched browser, launching one directly if none is ready"""
+        await self.start()
+        try:
+            browser = self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            browser = await self._launch()
+        self._refill()
+        return browser
+
+    async def release(self, browser: Browser) -> None:
+        """Return a browser to the pool, or close it if it is unhealthy or not needed"""
+        if browser.is_connected() and not self._idle.full():
+            for context in browser.contexts:
+                with contextlib.suppress(Exception):
+                    await context.close()
+            try:
+                self._idle.put_nowait(browser)
+                return
+            except asyncio.QueueFull:
+                # The background fill took the slot while contexts closed
+                pass
+
+        with contextlib.suppress(Exception):
+            await browser.close()
+
+    async def close(self) -> None:
+        """Close every pooled browser and stop Playwright"""
+        if self._filler and not self._filler.done():
+            self._filler.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._filler
+        self._filler = None
+
+        browsers: List[Browser] = []
+        while not self._idle.empty():
+            browsers.append(self._idle.get_nowait())
+        for browser in browsers:
+            with contextlib.suppress(Exception):
+                await browser.close()
+
+        if self.playwright:
+            with contextlib.suppress(Exception):
+                await self.playwright.stop()
+            self.playwright = None
@@ -1,18 +1,110 @@
-from typing import Dict, Optional, Any, Union
+from typing import Any, Callable, Dict, Optional, Tuple
 from enum import Enum
+import asyncio
 import logging
-import json
-from datetime import datetime
-import pytz
-from pathlib import Path
-from ..config.spoof_profiles import SpoofingProfiles, TIMEZONE_COORDINATES
-from ..config.geolocation_profiles import GeolocationProfiles, GeoLocation
+import threading
+import time
+import weakref
+import aiohttp
+import orjson
+from ..config.spoof_profiles import (
+    SpoofingProfiles,
+    validate_audio_config,
+    validate_timezone_config,
+)
+from ..config.geolocation_profiles import GeolocationProfiles
 from ..config.proxy_profiles import ProxyProfiles
 from .network_handler import NetworkRequestHandler
 from ..config.proxy_manager import ProxyManager
+from ..utils.js_minifier import minify_js
 
 logger = logging.getLogger(__name__)
 
+_IP_LOOKUP_URL = "https://api.ipify.org?format=json"
+_IP_LOOKUP_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# The exit IP only changes with the proxy; re-check it daily at most
+_IP_CACHE_TTL = 24 * 60 * 60
+
+
+# Logs the effective browser configuration to the page console on load,
+# minified once at import
+_SHOW_CONFIG_SCRIPT = """
+window.showBrowserConfig = async function() {
+    try {
+        let ipData = { ip: 'Checking...' };
+        // Prefer the IP looked up once on the Python side, then a recent
+        // lookup from this tab, instead of fetching per page
+        let cached = window.__IP_CACHE || null;
+        try {
+            cached = cached || JSON.parse(sessionStorage.getItem('__spoof_ip'));
+        } catch (error) {
+            // sessionStorage is unavailable on opaque origins
+        }
+        if (cached && (cached === window.__IP_CACHE || Date.now() - cached.ts < 60000)) {
+            ipData.ip = cached.ip;
+        } else {
+            try {
+                const ipResponse = await fetch('https://api.ipify.org?format=json', {
+                    timeout: 5000
+                });
+                ipData = await ipResponse.json();
+                try {
+                    sessionStorage.setItem('__spoof_ip', JSON.stringify({ ip: ipData.ip, ts: Date.now() }));
+                } catch (error) {
+                    // Not cacheable on this origin
+                }
+            } catch (error) {
+                console.warn('Failed to fetch IP:', error);
+                ipData.ip = 'Failed to fetch';
+            }
+        }
+
+        const config = {
+            'Browser Info': {
+                'User Agent': navigator.userAgent,
+                'Platform': navigator.platform,
+                'Language': navigator.language,
+                'Cookies Enabled': navigator.cookieEnabled
+            },
+            'Network': {
+                'IP Address': ipData.ip,
+                'Connection Type': navigator.connection?.effectiveType || 'Unknown',
+                'Downlink': navigator.connection?.downlink + ' Mbps' || 'Unknown'
+            },
+            'Screen & Hardware': {
+                'Resolution': `${window.screen.width}x${window.screen.height}`,
+                'Color Depth': window.screen.colorDepth + ' bits',
+                'Device Pixel Ratio': window.devicePixelRatio
+            },
+            'Timezone & Location': {
+                'Timezone': Intl.DateTimeFormat().resolvedOptions().timeZone,
+                'Locale': navigator.language
+            }
+        };
+
+        console.clear();
+        console.log('\\n=== Browser Configuration ===\\n');
+
+        for (const [category, items] of Object.entries(config)) {
+            console.log(`[${category}]`);
+            for (const [key, value] of Object.entries(items)) {
+                console.log(`${key.padEnd(20)} │ ${value}`);
+            }
+            console.log('');
+        }
+    } catch (error) {
+        console.error('Failed to show configuration:', error);
+    }
+};
+
+// Show config once per page load, from the top frame only
+if (window.top === window && !window.__SPOOF_LOGGED) {
+    window.__SPOOF_LOGGED = true;
+    showBrowserConfig();
+}
+"""
+_SHOW_CONFIG_SCRIPT = minify_js(_SHOW_CONFIG_SCRIPT)
+
 
 class SpooferType(Enum):
     TIMEZONE = "timezone"
@@ -21,135 +113,177 @@ class SpooferType(Enum):
     PROXY = "proxy"
 
 
+# Plain string keys for spoof_configs lookups on hot paths
+_TZ = SpooferType.TIMEZONE.value
+_AUDIO = SpooferType.AUDIO.value
+_GEO = SpooferType.GEOLOCATION.value
+_PROXY = SpooferType.PROXY.value
+
+
 class ContextSpoofer:
     """
     Handles timezone and audio context spoofing using Playwright's capabilities
     """
 
+    # Profile sets are loaded from disk once per process and shared
+    _shared_instances: Dict[type, Any] = {}
+    _shared_lock = threading.Lock()
+
+    # Contexts that already hold the geolocation permission; weak so closed
+    # contexts drop out on their own
+    _geo_granted: "weakref.WeakSet" = weakref.WeakSet()
+
+    # Validators per spoof type; types without an entry are not validated.
+    # Profiles drawn from SpoofingProfiles were already validated on load.
+    _VALIDATORS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+        _TZ: validate_timezone_config,
+        _AUDIO: validate_audio_config,
+    }
+
     def __init__(self, network_handler=None):
-        self.profiles = SpoofingProfiles()
-        self.geo_profiles = GeolocationProfiles()
-        self.proxy_profiles = ProxyProfiles()
-        self.proxy_manager = ProxyManager()
-        self.network_handler = network_handler or NetworkRequestHandler()
+        self.profiles = self._get_shared(SpoofingProfiles)
+        self.geo_profiles = self._get_shared(GeolocationProfiles)
+        self.proxy_profiles = self._get_shared(ProxyProfiles)
+        # One proxy pool per spoofer, shared with its network handler, since
+        # it carries the currently selected proxy; ProxyManager itself only
+        # reads the proxy lists from disk once per process
+        if network_handler:
+            self.proxy_manager = network_handler.proxy_manager
+        else:
+            self.proxy_manager = ProxyManager()
+        self.network_handler = network_handler or NetworkRequestHandler(
+            proxy_manager=self.proxy_manager
+        )
+        # Exit IP per proxy URL, with the time it was looked up
+        self._ip_cache: Dict[str, Tuple[float, str]] = {}
         self.spoof_configs = self._load_random_config()
-        self._validate_configs()
 
-    def _load_random_config(self) -> Dict[str, Dict[str, Any]]:
+    @classmethod
+    def _get_shared(cls, factory: Callable[[], Any]) -> Any:
+        """Return the process-wide instance built by factory, creating it on first use"""
+        instance = cls._shared_instances.get(factory)
+        if instance is None:
+            with cls._shared_lock:
+                instance = cls._shared_instances.get(factory)
+                if instance is None:
+                    instance = cls._shared_instances[factory] = factory()
+        return instance
+
+    def _load_random_config(self, device_type: str = None) -> Dict[str, Dict[str, Any]]:
         """Load random profile configuration"""
-        profile = self.profiles.get_random_profile()
+        profile = self.profiles.get_random_profile(device_type)
 
         # Get matching geolocation and proxy for timezone
-        geo_location, timezone, locale = self.geo_profiles.get_random_location(
+        geo_location, timezone, locale, region = self.geo_profiles.get_random_location(
             profile["timezone"].get("timezone_id")
         )
 
         # Get proxy from matching region
-        region = timezone.split("/")[0].upper()
         proxy = self.proxy_profiles.get_random_proxy(region)
 
+        # Copy the profile sections, configure_spoof updates them in place
         return {
-            SpooferType.TIMEZONE.value: profile["timezone"],
-            SpooferType.AUDIO.value: profile["audio"],
-            SpooferType.GEOLOCATION.value: {
+            _TZ: dict(profile["timezone"]),
+            _AUDIO: dict(profile["audio"]),
+            _GEO: {
                 "enabled": True,
                 "location": geo_location.to_dict(),
                 "timezone": timezone,
                 "locale": locale,
             },
-            SpooferType.PROXY.value: {"enabled": True, "config": proxy.to_dict()},
+            _PROXY: {"enabled": True, "config": proxy.to_dict()},
         }
 
     def _validate_configs(self) -> None:
         """Validate all configurations"""
-        if SpooferType.TIMEZONE.value in self.spoof_configs:
-            self._validate_timezone_config(
-                self.spoof_configs[SpooferType.TIMEZONE.value]
-            )
-        if SpooferType.AUDIO.value in self.spoof_configs:
-            self._validate_audio_config(self.spoof_configs[SpooferType.AUDIO.value])
+        for spoof_type, validator in self._VALIDATORS.items():
+            if spoof_type in self.spoof_configs:
+                validator(self.spoof_configs[spoof_type])
+
+    async def get_context_options(self) -> Dict[str, Any]:
+        """Get spoofing options for the caller's browser.new_context"""
+        # Proxies can only be set when a context is created, so the caller
+        # builds its context with these instead of the spoofer replacing it
+        options = self._spoof_context_options()
+
+        if self.network_handler:
+            # Setup proxy with proper error handling
+            if await self.network_handler.setup_proxy():
+                # Get proxy config only if setup was successful
+                proxy_config = self.network_handler.get_proxy_config()
+                if proxy_config:
+                    logger.info(f"Setting up proxy: {proxy_config.get('server')}")
+                    options["proxy"] = proxy_config
+                else:
+                    logger.warning("Proxy setup succeeded but no config available")
+            else:
+                logger.warning("Failed to setup proxy, continuing without proxy")
+
+        return options
+
+    def _spoof_context_options(self) -> Dict[str, Any]:
+        """Build new_context options for the current timezone and geolocation configs"""
+        options: Dict[str, Any] = {}
+
+        # Timezone, locale and geolocation ride along with context creation
+        # rather than costing a setter round trip each afterwards
+        tz_config = self.spoof_configs.get(_TZ, {})
+        if tz_config.get("enabled") and tz_config.get("timezone_id"):
+            options["timezone_id"] = tz_config["timezone_id"]
+            if tz_config.get("locale"):
+                options["locale"] = tz_config["locale"]
 
-    async def setup_spoofing(self, context) -> None:
+        geo_config = self.spoof_configs.get(_GEO, {})
+        if geo_config.get("enabled") and geo_config.get("location"):
+            options["geolocation"] = geo_config["location"]
+            options["permissions"] = ["geolocation"]
+
+        return options
+
+    async def setup_spoofing(
+        self, context, context_options: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Setup context spoofing and show configurations"""
         if not context:
             raise ValueError("Browser context is not initialized")
 
+        # Options the context was already created with need no setter call
+        applied = context_options or {}
+
         try:
-            # Setup proxy with proper error handling
-            if self.network_handler:
-                # First try to setup proxy
-                proxy_setup = await self.network_handler.setup_proxy()
-                if proxy_setup:
-                    # Get proxy config only if setup was successful
-                    proxy_config = self.network_handler.get_proxy_config()
-                    if proxy_config:
-                        logger.info(f"Setting up proxy: {proxy_config.get('server')}")
-                        # Create new context with proxy
-                        context = await context.browser.new_context(proxy=proxy_config)
-                    else:
-                        logger.warning("Proxy setup succeeded but no config available")
-                else:
-                    logger.warning("Failed to setup proxy, continuing without proxy")
-
-            # Add script to show configuration in all pages
-            await context.add_init_script("""
-                window.showBrowserConfig = async function() {
-                    try {
-                        let ipData = { ip: 'Checking...' };
-                        try {
-                            const ipResponse = await fetch('https://api.ipify.org?format=json', {
-                                timeout: 5000
-                            });
-                            ipData = await ipResponse.json();
-                        } catch (error) {
-                            console.warn('Failed to fetch IP:', error);
-                            ipData.ip = 'Failed to fetch';
-                        }
-                        
-                        const config = {
-                            'Browser Info': {
-                                'User Agent': navigator.userAgent,
-                                'Platform': navigator.platform,
-                                'Language': navigator.language,
-                                'Cookies Enabled': navigator.cookieEnabled
-                            },
-                            'Network': {
-                                'IP Address': ipData.ip,
-                                'Connection Type': navigator.connection?.effectiveType || 'Unknown',
-                                'Downlink': navigator.connection?.downlink + ' Mbps' || 'Unknown'
-                            },
-                            'Screen & Hardware': {
-                                'Resolution': `${window.screen.width}x${window.screen.height}`,
-                                'Color Depth': window.screen.colorDepth + ' bits',
-                                'Device Pixel Ratio': window.devicePixelRatio
-                            },
-                            'Timezone & Location': {
-                                'Timezone': Intl.DateTimeFormat().resolvedOptions().timeZone,
-                                'Locale': navigator.language
-                            }
-                        };
-
-                        console.clear();
-                        console.log('\\n=== Browser Configuration ===\\n');
-                        
-                        for (const [category, items] of Object.entries(config)) {
-                            console.log(`[${category}]`);
-                            for (const [key, value] of Object.entries(items)) {
-                                console.log(`${key.padEnd(20)} │ ${value}`);
-                            }
-                            console.log('');
-                        }
-                    } catch (error) {
-                        console.error('Failed to show configuration:', error);
-                    }
-                };
-                
-                // Show config on page load
-                showBrowserConfig();
-            """)
-
-            # Open new pages for configuration checking
-            await self._open_config_pages(context)
+            # Independent context calls, issued together instead of one
+            # round trip at a time
+            setup_calls = []
+            grant_geo = False
+            geo_config = self.spoof_configs.get(_GEO, {})
+            if (
+                geo_config.get("enabled")
+                and geo_config.get("location")
+                and "geolocation" not in applied
+            ):
+                if context not in self._geo_granted:
+                    setup_calls.append(context.grant_permissions(["geolocation"]))
+                    grant_geo = True
+                setup_calls.append(context.set_geolocation(geo_config["location"]))
+
+            # Config diagnostics cost an init script per document plus extra
+            # pages, so only pay for them when debug logging is on
+            show_diagnostics = logger.isEnabledFor(logging.DEBUG)
+            if show_diagnostics:
+                # Add script to show configuration in all pages, seeded with
+                # the exit IP so pages don't each fetch it again
+                ip = await self._get_current_ip(context)
+                ip_cache = f"window.__IP_CACHE = {orjson.dumps({'ip': ip}).decode()};\n" if ip else ""
+                setup_calls.append(context.add_init_script(ip_cache + _SHOW_CONFIG_SCRIPT))
+
+            await asyncio.gather(*setup_calls)
+            if grant_geo:
+                # Only remembered once the grant is known to have gone through
+                self._geo_granted.add(context)
+
+            if show_diagnostics:
+                # Open new pages for configuration checking
+                await self._open_config_pages(context)
             
             logger.info("Context spoofing setup completed")
 
@@ -160,18 +294,17 @@ class ContextSpoofer:
     async def _open_config_pages(self, context) -> None:
         """Open pages to check configuration"""
         try:
-            # First try a simple page to verify connection
-            test_page = await context.new_page()
-            await test_page.goto('http://example.com', timeout=2000)
-            await test_page.close()
-            
-            # If successful, open other pages
-            ip_page = await context.new_page()
-            await ip_page.goto('https://browserleaks.com/ip', timeout=30000)
+            # The pages don't depend on each other, so create and load them
+            # together; a broken connection surfaces from the IP page itself
+            ip_page, config_page = await asyncio.gather(
+                context.new_page(), context.new_page()
+            )
+            await asyncio.gather(
+                ip_page.goto('https://browserleaks.com/ip', timeout=30000),
+                config_page.goto('about:blank'),
+            )
             logger.info("Opened IP check page")
 
-            config_page = await context.new_page()
-            await config_page.goto('about:blank')
             await config_page.evaluate("showBrowserConfig()")
             logger.info("Opened configuration check page")
 
@@ -179,35 +312,19 @@ class ContextSpoofer:
             logger.error(f"Failed to open configuration pages: {e}")
             # Don't raise here, allow partial success
 
-    def configure_spoof(self, spoof_type: str, config: Dict[str, Any]) -> None:
-        """Configure specific spoof settings"""
+    def configure_spoof(
+        self, spoof_type: str, config: Dict[str, Any], validate: bool = True
+    ) -> None:
+        """Configure specific spoof settings, skipping validation for trusted configs"""
         if spoof_type not in self.spoof_configs:
             raise ValueError(f"Invalid spoof type: {spoof_type}")
 
+        validator = self._VALIDATORS.get(spoof_type) if validate else None
+        if validator:
+            validator(config)
+
         self.spoof_configs[spoof_type].update(config)
-        logger.debug(f"Updated {spoof_type} spoof configuration: {config}")
-
-    def _validate_timezone_config(self, config: Dict[str, Any]) -> None:
-        """Validate timezone configuration"""
-        if "timezone_id" in config:
-            try:
-                import zoneinfo
-
-                zoneinfo.ZoneInfo(config["timezone_id"])
-            except Exception as e:
-                raise ValueError(f"Invalid timezone: {e}")
-
-    def _validate_audio_config(self, config: Dict[str, Any]) -> None:
-        """Validate audio configuration"""
-        if "sample_rate" in config:
-            if not isinstance(config["sample_rate"], int) or config["sample_rate"] <= 0:
-                raise ValueError("Invalid sample rate")
-        if "channel_count" in config:
-            if (
-                not isinstance(config["channel_count"], int)
-                or config["channel_count"] <= 0
-            ):
-                raise ValueError("Invalid channel count")
+        logger.debug("Updated %s spoof configuration: %s", spoof_type, config)
 
     def get_spoof_config(self, spoof_type: str) -> Dict[str, Any]:
         """Get current spoof configuration"""
@@ -215,39 +332,75 @@ class ContextSpoofer:
 
     def randomize_config(self, device_type: str = None) -> None:
         """Randomize current configuration"""
-        profile = self.profiles.get_random_profile(device_type)
-        geo_location, timezone, locale = self.geo_profiles.get_random_location(
-            profile["timezone"].get("timezone_id")
+        self.spoof_configs = self._load_random_config(device_type)
+
+    async def log_browser_config(self, context) -> None:
+        """Log the applied spoof configuration"""
+        # Logged from Python; a throwaway page just to run showBrowserConfig
+        # cost three browser round trips
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        configs = dict(self.spoof_configs)
+        proxy_config = configs.get(_PROXY, {}).get("config") or {}
+        if proxy_config.get("password"):
+            # Keep proxy credentials out of the logs
+            configs[_PROXY] = {
+                **configs[_PROXY],
+                "config": {**proxy_config, "password": "***"},
+            }
+        logger.info(
+            "Browser spoof configuration: %s",
+            orjson.dumps(configs, default=str).decode(),
         )
 
-        self.spoof_configs = {
-            SpooferType.TIMEZONE.value: profile["timezone"],
-            SpooferType.AUDIO.value: profile["audio"],
-            SpooferType.GEOLOCATION.value: {
-                "enabled": True,
-                "location": geo_location.to_dict(),
-                "timezone": timezone,
-                "locale": locale,
-            },
-        }
-        self._validate_configs()
+    async def _get_current_ip(self, context) -> Optional[str]:
+        """Get current IP address through proxy"""
+        proxy_config = self.network_handler.get_proxy_config() if self.network_handler else None
+        proxy_url = proxy_config["server"] if proxy_config else None
 
-    async def log_browser_config(self, context) -> None:
-        """Log browser configuration to console"""
+        # The exit IP only changes with the proxy, so look it up once per proxy
+        cache_key = proxy_url or ""
+        cached = self._ip_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _IP_CACHE_TTL:
+            return cached[1]
+
+        if proxy_url and not proxy_url.startswith(("http://", "https://")):
+            # aiohttp can only tunnel through HTTP proxies
+            ip = await self._get_current_ip_from_page(context)
+        else:
+            ip = await self._get_current_ip_from_http(proxy_config)
+
+        if ip:
+            self._ip_cache[cache_key] = (time.monotonic(), ip)
+        return ip
+
+    async def _get_current_ip_from_http(
+        self, proxy_config: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """Get current IP address with a direct HTTP request through the proxy"""
+        proxy_url = proxy_config["server"] if proxy_config else None
         try:
-            page = await context.new_page()
-            await page.goto("about:blank")
-            await page.evaluate("showBrowserConfig()")
-            await page.close()
+            proxy_auth = None
+            if proxy_config and proxy_config.get("username"):
+                proxy_auth = aiohttp.BasicAuth(
+                    proxy_config["username"], proxy_config.get("password") or ""
+                )
+            async with aiohttp.ClientSession(timeout=_IP_LOOKUP_TIMEOUT) as session:
+                async with session.get(
+                    _IP_LOOKUP_URL, proxy=proxy_url, proxy_auth=proxy_auth
+                ) as response:
+                    data = await response.json()
+            return data.get("ip")
         except Exception as e:
-            logger.error(f"Failed to log browser configuration: {e}")
-            raise
+            logger.error(f"Failed to get IP address: {e}")
+            return None
 
-    async def _get_current_ip(self, context) -> Optional[str]:
-        """Get current IP address through proxy"""
+    async def _get_current_ip_from_page(self, context) -> Optional[str]:
+        """Get current IP address by loading the lookup URL in a browser page"""
         try:
             page = await context.new_page()
-            response = await page.goto("https://api.ipify.org?format=json")
+            response = await page.goto(_IP_LOOKUP_URL)
             data = await response.json()
             await page.close()
             return data.get("ip")
@@ -255,13 +408,23 @@ class ContextSpoofer:
             logger.error(f"Failed to get IP address: {e}")
             return None
 
-    async def rotate_proxy(self, context, region: Optional[str] = None) -> bool:
-        """Rotate proxy for current context"""
-        if await self.network_handler.rotate_proxy(region):
-            proxy_config = self.network_handler.get_proxy_config()
-            if proxy_config:
-                await context.route(
-                    "**/*", lambda route: route.continue_(proxy=proxy_config)
-                )
-                return True
-        return False
+    async def rotate_proxy(self, context, region: Optional[str] = None, **context_options):
+        """Rotate proxy, returning a new spoofed context that uses it"""
+        # Playwright only applies a proxy at context creation, so rotation
+        # means a fresh context; the caller closes the old one
+        old_proxy = self.network_handler.get_proxy_config()
+        if not await self.network_handler.rotate_proxy(region):
+            return None
+        proxy_config = self.network_handler.get_proxy_config()
+        if not proxy_config:
+            return None
+        if old_proxy:
+            self._ip_cache.pop(old_proxy["server"], None)
+
+        options = self._spoof_context_options()
+        options.update(context_options)
+        options["proxy"] = proxy_config
+
+        new_context = await context.browser.new_context(**options)
+        await self.setup_spoofing(new_context, options)
+        return new_context
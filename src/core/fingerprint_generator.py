@@ -1,18 +1,65 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from functools import cached_property, lru_cache
 from browserforge.fingerprints import FingerprintGenerator, Screen
 from browserforge.headers import HeaderGenerator, Browser
 from ..config.device_specs import DeviceProfileManager, DeviceType, BrowserFamily
 from ..config.locale_specs import LocaleManager
 from ..config.header_rules import HeaderRuleManager
-from .network_handler import NetworkRequestHandler
 import logging
+import queue
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Headers added to every matched API request besides the request ID
+_API_HEADERS = {"X-Custom-Header": "value"}
+
+
+# browserforge loads its network models once at import, but each generator
+# still reads and parses the browser and header-order JSON files when built
+# (FingerprintGenerator through its own HeaderGenerator), so build them once
+# per distinct configuration and share them
+@lru_cache(maxsize=32)
+def _get_header_generator(
+    browser: str, os: str, device: str, locale: str, http_version: str
+) -> HeaderGenerator:
+    return HeaderGenerator(
+        browser=browser,
+        os=os,
+        device=device,
+        locale=locale,
+        http_version=http_version,
+        strict=False
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_fingerprint_generator(
+    min_width: int, max_width: int, min_height: int, max_height: int
+) -> Tuple[Screen, FingerprintGenerator]:
+    screen = Screen(
+        min_width=min_width,
+        max_width=max_width,
+        min_height=min_height,
+        max_height=max_height
+    )
+    generator = FingerprintGenerator(
+        screen=screen,
+        strict=False,
+        mock_webrtc=True,
+        slim=False
+    )
+    return screen, generator
+
 
 class AnonymousFingerprint:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        pool_size: int = 0,
+        header_manager: Optional[HeaderRuleManager] = None,
+        network_handler=None
+    ) -> None:
         self.device_manager = DeviceProfileManager()
         self.locale_manager = LocaleManager()
         
@@ -23,32 +70,82 @@ class AnonymousFingerprint:
             device_type=default_device["device_type"]
         )
         
-        self.screen = Screen(
-            min_width=default_device["screen"]["width_range"][0],
-            max_width=default_device["screen"]["width_range"][1],
-            min_height=default_device["screen"]["height_range"][0],
-            max_height=default_device["screen"]["height_range"][1]
+        self.screen, self.fingerprint_generator = _get_fingerprint_generator(
+            default_device["screen"]["width_range"][0],
+            default_device["screen"]["width_range"][1],
+            default_device["screen"]["height_range"][0],
+            default_device["screen"]["height_range"][1]
         )
         
         # Initialize generators with locale support
-        self.header_generator = HeaderGenerator(
-            browser=default_device["browser"]["family"],
-            os=default_device["os"],
-            device=default_device["device_type"],
-            locale=default_locale["locale"],
-            http_version=default_locale["http_version"],
-            strict=False
-        )
-        
-        self.fingerprint_generator = FingerprintGenerator(
-            screen=self.screen,
-            strict=False,
-            mock_webrtc=True,
-            slim=False
+        self.header_generator = _get_header_generator(
+            default_device["browser"]["family"],
+            default_device["os"],
+            default_device["device_type"],
+            default_locale["locale"],
+            default_locale["http_version"]
         )
         
-        self.header_manager = HeaderRuleManager()
-        self.network_handler = NetworkRequestHandler()
+        self.header_manager = header_manager or HeaderRuleManager()
+        # Only needed for setup_browser_context, so built on first use
+        # unless the caller shares one
+        if network_handler is not None:
+            self.network_handler = network_handler
+
+        # Optional pool of fingerprints sampled ahead of time on a worker
+        # thread, for the default browser family
+        self.pool_size = pool_size
+        self._pool_browser = default_device["browser"]["family"]
+        self._pool: Optional["queue.Queue"] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if pool_size > 0:
+            self._start_pool()
+
+    @cached_property
+    def network_handler(self):
+        from .network_handler import NetworkRequestHandler
+        return NetworkRequestHandler()
+
+    def _start_pool(self) -> None:
+        """Start filling a fresh fingerprint pool on a worker thread"""
+        self._pool = queue.Queue(maxsize=self.pool_size)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        for _ in range(self.pool_size):
+            self._executor.submit(self._prefetch_fingerprint)
+
+    def _prefetch_fingerprint(self) -> None:
+        """Sample one fingerprint into the pool"""
+        pool = self._pool
+        if pool is None:
+            return
+        try:
+            fingerprint = self.fingerprint_generator.generate(browser=self._pool_browser)
+            pool.put_nowait(fingerprint)
+        except queue.Full:
+            pass
+        except Exception as e:
+            logger.error("Failed to prefetch fingerprint: %s", e)
+
+    def _next_fingerprint(self, browser: Any) -> Any:
+        """Take a pooled fingerprint for browser if one is ready, else sample one now"""
+        if self.pool_size > 0 and self._executor is None:
+            # Stopped by close(), start again for this generator's next user
+            self._start_pool()
+        if self._pool is not None and browser == self._pool_browser:
+            # Replace what we take so the pool stays full
+            self._executor.submit(self._prefetch_fingerprint)
+            try:
+                return self._pool.get_nowait()
+            except queue.Empty:
+                pass
+        return self.fingerprint_generator.generate(browser=browser)
+
+    def close(self) -> None:
+        """Stop the prefetch worker; the next generate() starts it again"""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._pool = None
 
     async def setup_browser_context(self, context) -> None:
         """Setup browser context with network handling"""
@@ -70,12 +167,7 @@ class AnonymousFingerprint:
 
     def _modify_api_request(self, request) -> Dict[str, Any]:
         """Example custom request modifier"""
-        headers = request.headers
-        # Add custom headers
-        headers.update({
-            "X-Custom-Header": "value",
-            "X-Request-ID": str(uuid.uuid4())
-        })
+        headers = {**request.headers, **_API_HEADERS, "X-Request-ID": uuid.uuid4().hex}
         return {"headers": headers}
 
     async def generate(
@@ -93,9 +185,7 @@ class AnonymousFingerprint:
             )
             
             # Generate fingerprint
-            fingerprint = self.fingerprint_generator.generate(
-                browser=device_config["browser"]["family"]
-            )
+            fingerprint = self._next_fingerprint(device_config["browser"]["family"])
             
             # Generate headers
             headers = self.header_manager.generate_headers(
@@ -111,6 +201,7 @@ class AnonymousFingerprint:
                         "height": device_config["screen"]["height_range"][0]
                     }
                 },
+                "browserforge_fingerprint": fingerprint,
                 "headers": headers,
                 "locale_info": locale_config
             }
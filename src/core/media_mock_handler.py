@@ -1,11 +1,108 @@
-from typing import Dict, Optional, Any, List
+from typing import Any, Callable, Dict, Optional, Tuple
 from enum import Enum
 import logging
-import json
-from pathlib import Path
+import orjson
+from string import Template
+from ..utils.js_minifier import minify_js
 
 logger = logging.getLogger(__name__)
 
+# Init script templates, minified and parsed once at import. String values are
+# substituted as JSON literals so quotes in configs can't break the script.
+# Each mock runs in its own function scope since they share one init script.
+_WEBRTC_MOCK_SCRIPT = minify_js("""
+(() => {
+window.navigator.mediaDevices.getUserMedia = async (constraints) => {
+    const mockStream = new MediaStream();
+    if (constraints.video) {
+        mockStream.addTrack(createMockVideoTrack());
+    }
+    if (constraints.audio) {
+        mockStream.addTrack(createMockAudioTrack());
+    }
+    return mockStream;
+};
+
+function createMockVideoTrack() {
+    const canvas = Object.assign(document.createElement('canvas'), {
+        width: 640,
+        height: 480
+    });
+    const ctx = canvas.getContext('2d');
+    const stream = canvas.captureStream(30);  // 30 FPS
+    setInterval(() => {
+        // Draw something to simulate video
+        ctx.fillStyle = '#' + Math.floor(Math.random()*16777215).toString(16);
+        ctx.fillRect(0, 0, canvas.width, canvas.height);
+    }, 1000 / 30);
+    return stream.getVideoTracks()[0];
+}
+
+function createMockAudioTrack() {
+    const ctx = new AudioContext();
+    const oscillator = ctx.createOscillator();
+    const dst = oscillator.connect(ctx.createMediaStreamDestination());
+    oscillator.start();
+    return dst.stream.getAudioTracks()[0];
+}
+})();
+""")
+
+_CANVAS_MOCK_TEMPLATE = Template(minify_js("""
+(() => {
+const originalGetContext = HTMLCanvasElement.prototype.getContext;
+HTMLCanvasElement.prototype.getContext = function() {
+    const context = originalGetContext.apply(this, arguments);
+    if (context && (arguments[0] === '2d' || arguments[0] === 'bitmaprenderer')) {
+        const originalGetImageData = context.getImageData;
+        context.getImageData = function() {
+            const imageData = originalGetImageData.apply(this, arguments);
+            // Add noise to prevent fingerprinting; one xorshift32 step per
+            // pixel feeds all three colour channels
+            const data = imageData.data;
+            const amp = $noise_amp;
+            if (amp > 0) {
+                let s = (Math.random() * 0xffffffff) | 0 || 1;
+                for (let i = 0; i < data.length; i += 4) {
+                    s ^= s << 13;
+                    s ^= s >>> 17;
+                    s ^= s << 5;
+                    data[i] += (s & 0xff) % amp;
+                    data[i + 1] += ((s >>> 8) & 0xff) % amp;
+                    data[i + 2] += ((s >>> 16) & 0xff) % amp;
+                }
+            }
+            return imageData;
+        };
+    }
+    return context;
+};
+})();
+"""))
+
+_WEBGL_MOCK_TEMPLATE = Template(minify_js("""
+(() => {
+const originalGetContext = HTMLCanvasElement.prototype.getContext;
+HTMLCanvasElement.prototype.getContext = function() {
+    const context = originalGetContext.apply(this, arguments);
+    if (context && (arguments[0] === 'webgl' || arguments[0] === 'webgl2')) {
+        const getParameter = context.getParameter.bind(context);
+        context.getParameter = function(parameter) {
+            // Mock WebGL parameters
+            if (parameter === context.VENDOR) {
+                return $vendor;
+            }
+            if (parameter === context.RENDERER) {
+                return $renderer;
+            }
+            return getParameter(parameter);
+        };
+    }
+    return context;
+};
+})();
+"""))
+
 class MediaType(Enum):
     WEBRTC = "webrtc"
     CANVAS = "canvas" 
@@ -36,6 +133,18 @@ class MediaMockHandler:
                 "noise_value": 0.05
             }
         }
+        # Rendered init scripts per media type, with the config values they
+        # were rendered from
+        self._compiled_scripts: Dict[str, Tuple[Tuple[Any, ...], str]] = {}
+
+    def _compiled_script(
+        self, media_type: str, key: Tuple[Any, ...], build: Callable[[], str]
+    ) -> str:
+        """Return the rendered script for media_type, rebuilding it only when key changes"""
+        cached = self._compiled_scripts.get(media_type)
+        if cached is None or cached[0] != key:
+            cached = self._compiled_scripts[media_type] = (key, build())
+        return cached[1]
 
     async def setup_mocks(self, context) -> None:
         """Setup all media mocks for a browser context"""
@@ -43,14 +152,17 @@ class MediaMockHandler:
             raise ValueError("Browser context is not initialized")
 
         try:
-            # Setup WebRTC mocking
-            await self._setup_webrtc_mock(context)
-            
-            # Setup Canvas mocking
-            await self._setup_canvas_mock(context)
-            
-            # Setup WebGL mocking
-            await self._setup_webgl_mock(context)
+            # All enabled mocks go in a single init script, one round trip
+            scripts = [
+                script for script in (
+                    self._webrtc_mock_script(),
+                    self._canvas_mock_script(),
+                    self._webgl_mock_script(),
+                )
+                if script
+            ]
+            if scripts:
+                await context.add_init_script("\n".join(scripts))
             
             logger.debug("Media mocking setup complete")
             
@@ -58,103 +170,42 @@ class MediaMockHandler:
             logger.error(f"Failed to setup media mocks: {str(e)}")
             raise
 
-    async def _setup_webrtc_mock(self, context) -> None:
-        """Setup WebRTC mocking"""
+    def _webrtc_mock_script(self) -> Optional[str]:
+        """WebRTC mocking script, or None if disabled"""
         if not self.mock_configs[MediaType.WEBRTC.value]["enabled"]:
-            return
-
-        # Inject WebRTC mocking script
-        await context.add_init_script("""
-            window.navigator.mediaDevices.getUserMedia = async (constraints) => {
-                const mockStream = new MediaStream();
-                if (constraints.video) {
-                    mockStream.addTrack(createMockVideoTrack());
-                }
-                if (constraints.audio) {
-                    mockStream.addTrack(createMockAudioTrack());
-                }
-                return mockStream;
-            };
-
-            function createMockVideoTrack() {
-                const canvas = Object.assign(document.createElement('canvas'), {
-                    width: 640,
-                    height: 480
-                });
-                const ctx = canvas.getContext('2d');
-                const stream = canvas.captureStream(30);  // 30 FPS
-                setInterval(() => {
-                    // Draw something to simulate video
-                    ctx.fillStyle = '#' + Math.floor(Math.random()*16777215).toString(16);
-                    ctx.fillRect(0, 0, canvas.width, canvas.height);
-                }, 1000 / 30);
-                return stream.getVideoTracks()[0];
-            }
+            return None
 
-            function createMockAudioTrack() {
-                const ctx = new AudioContext();
-                const oscillator = ctx.createOscillator();
-                const dst = oscillator.connect(ctx.createMediaStreamDestination());
-                oscillator.start();
-                return dst.stream.getAudioTracks()[0];
-            }
-        """)
+        return _WEBRTC_MOCK_SCRIPT
 
-    async def _setup_canvas_mock(self, context) -> None:
-        """Setup Canvas mocking"""
+    def _canvas_mock_script(self) -> Optional[str]:
+        """Canvas mocking script, or None if disabled"""
         if not self.mock_configs[MediaType.CANVAS.value]["enabled"]:
-            return
+            return None
 
-        noise_value = self.mock_configs[MediaType.CANVAS.value]["noise_value"]
+        # Noise span per channel, fixed into the script as an integer literal
+        noise_amp = int(self.mock_configs[MediaType.CANVAS.value]["noise_value"] * 255)
         
-        await context.add_init_script(f"""
-            const originalGetContext = HTMLCanvasElement.prototype.getContext;
-            HTMLCanvasElement.prototype.getContext = function() {{
-                const context = originalGetContext.apply(this, arguments);
-                if (context && (arguments[0] === '2d' || arguments[0] === 'bitmaprenderer')) {{
-                    const originalGetImageData = context.getImageData;
-                    context.getImageData = function() {{
-                        const imageData = originalGetImageData.apply(this, arguments);
-                        // Add noise to prevent fingerprinting
-                        for (let i = 0; i < imageData.data.length; i += 4) {{
-                            imageData.data[i] += Math.floor(Math.random() * {noise_value} * 255);
-                            imageData.data[i + 1] += Math.floor(Math.random() * {noise_value} * 255);
-                            imageData.data[i + 2] += Math.floor(Math.random() * {noise_value} * 255);
-                        }}
-                        return imageData;
-                    }};
-                }}
-                return context;
-            }};
-        """)
-
-    async def _setup_webgl_mock(self, context) -> None:
-        """Setup WebGL mocking"""
+        return self._compiled_script(
+            MediaType.CANVAS.value,
+            (noise_amp,),
+            lambda: _CANVAS_MOCK_TEMPLATE.substitute(noise_amp=noise_amp)
+        )
+
+    def _webgl_mock_script(self) -> Optional[str]:
+        """WebGL mocking script, or None if disabled"""
         if not self.mock_configs[MediaType.WEBGL.value]["enabled"]:
-            return
+            return None
 
         config = self.mock_configs[MediaType.WEBGL.value]
         
-        await context.add_init_script(f"""
-            const originalGetContext = HTMLCanvasElement.prototype.getContext;
-            HTMLCanvasElement.prototype.getContext = function() {{
-                const context = originalGetContext.apply(this, arguments);
-                if (context && (arguments[0] === 'webgl' || arguments[0] === 'webgl2')) {{
-                    const getParameter = context.getParameter.bind(context);
-                    context.getParameter = function(parameter) {{
-                        // Mock WebGL parameters
-                        if (parameter === context.VENDOR) {{
-                            return "{config['vendor']}";
-                        }}
-                        if (parameter === context.RENDERER) {{
-                            return "{config['renderer']}";
-                        }}
-                        return getParameter(parameter);
-                    }};
-                }}
-                return context;
-            }};
-        """)
+        return self._compiled_script(
+            MediaType.WEBGL.value,
+            (config["vendor"], config["renderer"]),
+            lambda: _WEBGL_MOCK_TEMPLATE.substitute(
+                vendor=orjson.dumps(config["vendor"]).decode(),
+                renderer=orjson.dumps(config["renderer"]).decode()
+            )
+        )
 
     def configure_mock(self, media_type: str, config: Dict[str, Any]) -> None:
         """Configure specific media mock settings"""
@@ -162,7 +213,8 @@ class MediaMockHandler:
             raise ValueError(f"Invalid media type: {media_type}")
             
         self.mock_configs[media_type].update(config)
-        logger.debug(f"Updated {media_type} mock configuration: {config}")
+        self._compiled_scripts.pop(media_type, None)
+        logger.debug("Updated %s mock configuration: %s", media_type, config)
 
     def get_mock_config(self, media_type: str) -> Dict[str, Any]:
         """Get current mock configuration"""
@@ -21,6 +21,27 @@ class RequestType(Enum):
     WEBSOCKET = "websocket"
     OTHER = "other"
 
+# Resource types passed straight through without block or filter checks
+_PASS_THROUGH_TYPES = frozenset({RequestType.DOCUMENT.value, RequestType.STYLESHEET.value})
+
+# URL schemes served locally by the browser, never trackers or filtered APIs
+_LOCAL_SCHEMES = ("data:", "blob:")
+
+
+def _netloc(url: str) -> str:
+    """Return the netloc of url, as urlparse would, without parsing the rest"""
+    start = url.find("://")
+    # Only an authority right after the scheme counts (not e.g. blob:https://)
+    if start < 0 or url.find(":") != start:
+        return ""
+    start += 3
+    end = len(url)
+    for sep in "/?#":
+        i = url.find(sep, start, end)
+        if i >= 0:
+            end = i
+    return url[start:end]
+
 class NetworkRequestHandler:
     """
     Handles automatic network request management using Playwright's capabilities
@@ -33,6 +54,8 @@ class NetworkRequestHandler:
                  proxy_manager: Optional[ProxyManager] = None):
         self.blocked_resources: List[str] = []
         self.request_filters: Dict[str, Callable] = {}
+        # Compiled form of request_filters, rebuilt after filters change
+        self._compiled_filters: Optional[tuple] = None
         self.response_handlers: Dict[str, Callable] = {}
         self.block_trackers = block_trackers
         self.block_media = block_media
@@ -70,17 +93,17 @@ class NetworkRequestHandler:
             "hotjar.com",
             "analytics"
         }
+        # One case-insensitive scan per URL instead of a substring test per tracker
+        self._tracker_re = re.compile(
+            "|".join(re.escape(tracker) for tracker in self.tracker_domains),
+            re.IGNORECASE
+        )
 
     def is_allowed_domain(self, url: str) -> bool:
         """Check if domain is in allowed list"""
         if not self.allowed_domains:
             return True
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc
-            return domain in self.allowed_domains
-        except:
-            return True
+        return _netloc(url) in self.allowed_domains
 
     async def setup_request_interception(self, context) -> None:
         """Setup network request interception for a browser context"""
@@ -99,20 +122,25 @@ class NetworkRequestHandler:
             resource_type = request.resource_type
             url = request.url
 
+            # Inline and in-memory resources skip every check
+            if url.startswith(_LOCAL_SCHEMES):
+                await route.continue_()
+                return
+
             # Quick check for allowed domains
             if not self.is_allowed_domain(url):
                 await route.continue_()
                 return
 
             # Performance optimization: continue early for essential resources
-            if resource_type in [RequestType.DOCUMENT.value, RequestType.STYLESHEET.value]:
+            if resource_type in _PASS_THROUGH_TYPES:
                 await route.continue_()
                 return
 
             # Check if request should be blocked
             if self._should_block_request(url, resource_type):
                 await route.abort()
-                logger.debug(f"Blocked request to: {url}")
+                logger.debug("Blocked request to: %s", url)
                 return
 
             # Apply custom filters
@@ -128,13 +156,13 @@ class NetworkRequestHandler:
             await route.continue_()
             
         except Exception as e:
-            logger.error(f"Error handling route: {str(e)}")
+            logger.error("Error handling route: %s", e)
             await route.continue_()
 
     def _should_block_request(self, url: str, resource_type: str) -> bool:
         """Determine if request should be blocked based on configuration"""
         # Check trackers
-        if self.block_trackers and any(tracker in url.lower() for tracker in self.tracker_domains):
+        if self.block_trackers and self._tracker_re.search(url):
             return True
             
         # Check resource types based on configuration
@@ -148,17 +176,51 @@ class NetworkRequestHandler:
 
     def _apply_request_filters(self, request: Request) -> Optional[Dict[str, Any]]:
         """Apply custom request filters"""
+        if not self.request_filters:
+            return None
+        if self._compiled_filters is None:
+            self._compiled_filters = self._compile_request_filters()
+        filters, combined = self._compiled_filters
+
         url = request.url
-        
-        for pattern, filter_func in self.request_filters.items():
-            if re.match(pattern, url):
-                try:
-                    return filter_func(request)
-                except Exception as e:
-                    logger.error(f"Error applying request filter: {str(e)}")
-                    return None
-        
-        return None
+        filter_func = None
+        if combined is not None:
+            # The first matching alternative is the first matching filter
+            match = combined.match(url)
+            if match:
+                filter_func = filters[int(match.lastgroup[1:])][1]
+        else:
+            for pattern, func in filters:
+                if pattern.match(url):
+                    filter_func = func
+                    break
+
+        if filter_func is None:
+            return None
+        try:
+            return filter_func(request)
+        except Exception as e:
+            logger.error("Error applying request filter: %s", e)
+            return None
+
+    def _compile_request_filters(self) -> tuple:
+        """Compile filter patterns, combined into one alternation when they allow it"""
+        filters = [
+            (re.compile(pattern), func)
+            for pattern, func in self.request_filters.items()
+        ]
+        # Patterns with their own groups could hold backreferences that
+        # would point elsewhere once combined, so those stay separate
+        combined = None
+        if all(pattern.groups == 0 for pattern, _ in filters):
+            try:
+                combined = re.compile("|".join(
+                    f"(?P<f{i}>{pattern.pattern})" for i, (pattern, _) in enumerate(filters)
+                ))
+            except re.error:
+                # e.g. a pattern with inline global flags
+                combined = None
+        return filters, combined
 
     def add_request_filter(
         self,
@@ -167,6 +229,7 @@ class NetworkRequestHandler:
     ) -> None:
         """Add custom request filter"""
         self.request_filters[url_pattern] = filter_func
+        self._compiled_filters = None
         
     def add_response_handler(
         self,
@@ -194,6 +257,8 @@ class NetworkRequestHandler:
         """Update blocking options dynamically"""
         if block_trackers is not None:
             self.block_trackers = block_trackers
+            if block_trackers and not hasattr(self, "_tracker_re"):
+                self._init_tracker_blocklist()
         if block_media is not None:
             self.block_media = block_media
         if block_images is not None:
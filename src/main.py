@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 import asyncio
+import logging
 from rich.console import Console
 from typing import Optional
 import time
@@ -68,4 +69,6 @@ async def main():
             console.print("[bold green]Browser closed successfully![/]")
 
 if __name__ == "__main__":
+    # Request/response logs are emitted at DEBUG and stay disabled at INFO
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
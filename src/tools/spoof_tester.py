@@ -2,7 +2,7 @@ import asyncio
 from rich.console import Console
 from rich.table import Table
 from src.core.browser_manager import AnonymousBrowser
-import json
+import orjson
 
 console = Console()
 
@@ -17,32 +17,29 @@ async def interactive_test():
         table.add_column("Test", style="cyan")
         table.add_column("Result", style="green")
         
-        # Test timezone
-        console.print("\n[bold]Testing Timezone Spoofing...[/]")
-        timezone_result = await browser.page.evaluate("""
-            () => {
-                return {
-                    timezone: Intl.DateTimeFormat().resolvedOptions().timeZone,
-                    date: new Date().toLocaleString(),
-                    offset: new Date().getTimezoneOffset()
-                }
-            }
-        """)
-        table.add_row("Timezone", json.dumps(timezone_result, indent=2))
-        
-        # Test audio
-        console.print("\n[bold]Testing Audio Context...[/]")
-        audio_result = await browser.page.evaluate("""
+        # Probe timezone and audio in a single round trip
+        console.print("\n[bold]Testing Timezone Spoofing and Audio Context...[/]")
+        result = await browser.page.evaluate("""
             () => {
                 const ctx = new AudioContext();
                 return {
-                    sampleRate: ctx.sampleRate,
-                    channelCount: ctx.destination.channelCount,
-                    state: ctx.state
+                    timezone: {
+                        timezone: Intl.DateTimeFormat().resolvedOptions().timeZone,
+                        date: new Date().toLocaleString(),
+                        offset: new Date().getTimezoneOffset()
+                    },
+                    audio: {
+                        sampleRate: ctx.sampleRate,
+                        channelCount: ctx.destination.channelCount,
+                        state: ctx.state
+                    }
                 }
             }
         """)
-        table.add_row("Audio", json.dumps(audio_result, indent=2))
+        timezone_result = result["timezone"]
+        audio_result = result["audio"]
+        table.add_row("Timezone", orjson.dumps(timezone_result, option=orjson.OPT_INDENT_2).decode())
+        table.add_row("Audio", orjson.dumps(audio_result, option=orjson.OPT_INDENT_2).decode())
         
         # Display results
         console.print(table)
@@ -1,23 +1,45 @@
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from browserforge.fingerprints import Fingerprint
-import json
+import orjson
 
 console = Console()
 
+# Display config and its JSON for the most recently shown fingerprint.
+# Fingerprints aren't modified after generation, so the same object always
+# formats the same way and repeated injections can reuse the result.
+_last_display: Optional[Tuple[Any, Dict[str, Any], Optional[str]]] = None
+
 def format_fingerprint_for_display(fingerprint: Fingerprint) -> Dict[str, Any]:
     """Convert Fingerprint object to both compact and detailed format"""
+    global _last_display
+    entry = _last_display
+    if entry is None or entry[0] is not fingerprint:
+        entry = _last_display = (fingerprint, _build_display_config(fingerprint), None)
+    return entry[1]
+
+def _attrs(obj: Any) -> Dict[str, Any]:
+    """Instance attributes of obj, so optional fields are plain dict lookups"""
+    try:
+        return vars(obj)
+    except TypeError:
+        # Objects without a __dict__, e.g. slotted classes
+        return {name: getattr(obj, name, None) for name in dir(obj) if not name.startswith("_")}
+
+def _build_display_config(fingerprint: Fingerprint) -> Dict[str, Any]:
     navigator = fingerprint.navigator
     screen = fingerprint.screen
+    nav = _attrs(navigator)
+    scr = _attrs(screen)
     
     return {
         # Compact display
         "compact": {
             "id": navigator.userAgent.split('/')[-2].split()[0][:3].upper(),
             "os": navigator.platform.split()[0],
-            "hw": f"{navigator.hardwareConcurrency}C/{getattr(navigator, 'deviceMemory', 'N/A')}GB",
+            "hw": f"{navigator.hardwareConcurrency}C/{nav.get('deviceMemory', 'N/A')}GB",
             "res": f"{screen.width}x{screen.height}@{screen.devicePixelRatio}x"
         },
         # Detailed display
@@ -25,26 +47,26 @@ def format_fingerprint_for_display(fingerprint: Fingerprint) -> Dict[str, Any]:
             "Browser Info": {
                 "User Agent": navigator.userAgent,
                 "Platform": navigator.platform,
-                "Language": getattr(navigator, 'language', 'N/A'),
-                "Languages": ", ".join(getattr(navigator, 'languages', ['N/A']))
+                "Language": nav.get('language', 'N/A'),
+                "Languages": ", ".join(nav.get('languages', ['N/A']))
             },
             "Hardware": {
                 "CPU Cores": str(navigator.hardwareConcurrency),
-                "Memory": f"{getattr(navigator, 'deviceMemory', 'N/A')}GB",
-                "Touch Points": str(getattr(navigator, 'maxTouchPoints', 0)),
+                "Memory": f"{nav.get('deviceMemory', 'N/A')}GB",
+                "Touch Points": str(nav.get('maxTouchPoints', 0)),
                 "Color Depth": f"{screen.colorDepth}bit"
             },
             "Screen": {
                 "Resolution": f"{screen.width}x{screen.height}",
                 "Pixel Ratio": str(screen.devicePixelRatio),
-                "Available Size": f"{getattr(screen, 'availWidth', screen.width)}x{getattr(screen, 'availHeight', screen.height)}",
+                "Available Size": f"{scr.get('availWidth', screen.width)}x{scr.get('availHeight', screen.height)}",
                 "Color Depth": f"{screen.colorDepth}-bit"
             },
             "Additional": {
-                "Timezone": getattr(navigator, 'timezone', 'N/A'),
-                "Product": getattr(navigator, 'product', 'N/A'),
-                "Vendor": getattr(navigator, 'vendor', 'N/A'),
-                "Do Not Track": getattr(navigator, 'doNotTrack', 'N/A')
+                "Timezone": nav.get('timezone', 'N/A'),
+                "Product": nav.get('product', 'N/A'),
+                "Vendor": nav.get('vendor', 'N/A'),
+                "Do Not Track": nav.get('doNotTrack', 'N/A')
             }
         }
     }
@@ -59,5 +81,10 @@ def show_active_config(fingerprint: Fingerprint) -> None:
 
 def get_js_config(fingerprint: Fingerprint) -> str:
     """Generate JavaScript-compatible configuration object"""
+    global _last_display
     config = format_fingerprint_for_display(fingerprint)
-    return json.dumps(config) 
\ No newline at end of file
+    entry = _last_display
+    if entry[2] is None:
+        js_config = orjson.dumps(config, option=orjson.OPT_NON_STR_KEYS).decode()
+        entry = _last_display = (entry[0], config, js_config)
+    return entry[2]
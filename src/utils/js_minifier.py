@@ -0,0 +1,14 @@
+def minify_js(source: str) -> str:
+    """
+    Strip indentation, blank lines and whole-line comments from injected JavaScript
+
+    Line breaks are preserved so automatic semicolon insertion and template
+    literals keep working; this is meant to run once at import time.
+    """
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        lines.append(line)
+    return "\n".join(lines)
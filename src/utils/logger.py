@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 from rich.logging import RichHandler
 from rich.console import Console
 from rich.traceback import install
@@ -8,6 +9,23 @@ from ..config.settings import LOGGING_CONFIG
 # Install rich traceback handler
 install(show_locals=True)
 
+@lru_cache(maxsize=None)
+def _get_rich_handler() -> RichHandler:
+    """Build the console handler once and share it between loggers"""
+    # Create console for rich output
+    console = Console(force_terminal=True)
+    
+    # Configure rich handler
+    return RichHandler(
+        console=console,
+        enable_link_path=True,
+        markup=True,
+        rich_tracebacks=True,
+        tracebacks_show_locals=True,
+        tracebacks_extra_lines=2,
+        log_time_format="[%X]"
+    )
+
 def setup_logger_v1(name: str) -> logging.Logger:
     """
     @deprecated: Use setup_logger_v2 instead
@@ -32,7 +50,8 @@ def setup_logger_v1(name: str) -> logging.Logger:
 def setup_logger_v2(
     name: str,
     log_file: Optional[str] = None,
-    level: str = "INFO"
+    level: str = "INFO",
+    quiet_modules: Optional[Iterable[str]] = None
 ) -> logging.Logger:
     """
     Configure and return an enhanced logger instance with Rich formatting
@@ -41,24 +60,12 @@ def setup_logger_v2(
         name: Logger name
         log_file: Optional file path for logging
         level: Logging level (default: INFO)
+        quiet_modules: Logger names (e.g. "src.core.network_handler") whose
+            records are dropped instead of reaching the Rich handler
     
     Returns:
         logging.Logger: Configured logger instance
     """
-    # Create console for rich output
-    console = Console(force_terminal=True)
-    
-    # Configure rich handler
-    rich_handler = RichHandler(
-        console=console,
-        enable_link_path=True,
-        markup=True,
-        rich_tracebacks=True,
-        tracebacks_show_locals=True,
-        tracebacks_extra_lines=2,
-        log_time_format="[%X]"
-    )
-
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(level)
@@ -67,7 +74,7 @@ def setup_logger_v2(
     logger.handlers = []
     
     # Add rich handler
-    logger.addHandler(rich_handler)
+    logger.addHandler(_get_rich_handler())
     
     # Add file handler if specified
     if log_file:
@@ -78,6 +85,12 @@ def setup_logger_v2(
         )
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
+
+    # Keep chatty hot-path modules out of Rich rendering entirely
+    for module in quiet_modules or ():
+        quiet_logger = logging.getLogger(module)
+        quiet_logger.handlers = [logging.NullHandler()]
+        quiet_logger.propagate = False
     
     return logger
 
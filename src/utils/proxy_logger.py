@@ -8,36 +8,57 @@ console = Console()
 logger = logging.getLogger(__name__)
 
 class ProxyLogger:
+    # Status table columns: header and style
+    _STATUS_COLUMNS = (("Property", "cyan"), ("Value", "green"))
+
     def __init__(self):
-        self.console = Console()
+        # Share the module console instead of probing the terminal per instance
+        self.console = console
+        # Without a terminal, plain log records replace Rich panels
+        self._tty = self.console.is_terminal
         
     def log_proxy_status(self, proxy_config, ip_info=None):
         """Log proxy status in a formatted table"""
-        table = Table(title="🌐 Proxy Configuration", show_header=True)
-        
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="green")
-        
+        # Nothing would be shown, so skip building the table
+        if self.console.quiet:
+            return
+
         if proxy_config:
-            table.add_row("Status", "✅ Connected")
-            table.add_row("Server", proxy_config.get("server", "N/A"))
-            table.add_row("Protocol", proxy_config.get("protocol", "N/A"))
-            table.add_row("Region", proxy_config.get("region", "N/A"))
+            rows = [
+                ("Status", "✅ Connected"),
+                ("Server", proxy_config.get("server", "N/A")),
+                ("Protocol", proxy_config.get("protocol", "N/A")),
+                ("Region", proxy_config.get("region", "N/A")),
+            ]
         else:
-            table.add_row("Status", "❌ Not Connected")
+            rows = [("Status", "❌ Not Connected")]
             
         if ip_info:
-            table.add_row("Current IP", ip_info.get("ip", "N/A"))
-            table.add_row("Country", ip_info.get("country", "N/A"))
-            table.add_row("City", ip_info.get("city", "N/A"))
-            table.add_row("ISP", ip_info.get("isp", "N/A"))
+            rows += [
+                ("Current IP", ip_info.get("ip", "N/A")),
+                ("Country", ip_info.get("country", "N/A")),
+                ("City", ip_info.get("city", "N/A")),
+                ("ISP", ip_info.get("isp", "N/A")),
+            ]
+
+        table = Table(title="🌐 Proxy Configuration", show_header=True)
+        for header, style in self._STATUS_COLUMNS:
+            table.add_column(header, style=style)
+        for row in rows:
+            table.add_row(*row)
             
         self.console.print(table)
         
     def log_proxy_change(self, old_proxy, new_proxy):
         """Log when proxy changes"""
+        old_server = old_proxy.server if old_proxy else 'None'
+        new_server = new_proxy.server if new_proxy else 'None'
+        if not self._tty:
+            logger.info("Proxy rotated %s -> %s", old_server, new_server)
+            return
+
         panel = Panel(
-            f"Proxy Changed\nFrom: {old_proxy.server if old_proxy else 'None'}\nTo: {new_proxy.server if new_proxy else 'None'}",
+            "\n".join(("Proxy Changed", f"From: {old_server}", f"To: {new_server}")),
             title="🔄 Proxy Rotation",
             style="yellow"
         )
@@ -45,6 +66,10 @@ class ProxyLogger:
         
     def log_proxy_error(self, error_msg):
         """Log proxy errors"""
+        if not self._tty:
+            logger.error("Proxy error: %s", error_msg)
+            return
+
         panel = Panel(
             str(error_msg),
             title="❌ Proxy Error",
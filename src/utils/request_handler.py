@@ -1,10 +1,14 @@
-from typing import TypeVar, Callable, Optional, Dict, Any
+from typing import TypeVar, Callable, Optional, Any, Literal, Mapping, Tuple, Type
 import asyncio
-from datetime import datetime, timedelta
+import orjson
 import logging
+import random
+import sys
 from functools import wraps
 import time
-from dataclasses import dataclass
+import warnings
+import weakref
+from dataclasses import dataclass, field
 import aiohttp
 from aiohttp import ClientTimeout
 
@@ -12,26 +16,105 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')  # Generic type for return value
 
-@dataclass
+# Configs are read on every request; slots (3.10+) drop the per-instance
+# __dict__ and make those reads cheaper
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Connection pool and DNS cache shared by every handler on an event loop;
+# connectors are bound to the loop they were created on
+_shared_connectors: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the TCP connector shared by handlers on the running loop"""
+    loop = asyncio.get_running_loop()
+    connector = _shared_connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = _shared_connectors[loop] = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=30,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+    return connector
+
+async def shutdown() -> None:
+    """Close the shared TCP connector of the running loop"""
+    connector = _shared_connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None:
+        await connector.close()
+
+class RetryError(RuntimeError):
+    """Raised when an operation still fails after all retry attempts"""
+    def __init__(self, attempts: int, last_exc: Optional[BaseException]):
+        self.attempts = attempts
+        self.last_exc = last_exc
+        super().__init__(f"Operation failed after {attempts} attempts. Last error: {last_exc!r}")
+
+@dataclass(frozen=True, **_SLOTS)
 class RetryConfig:
     max_attempts: int = 3
     base_delay: float = 1.0  # seconds
     max_delay: float = 10.0  # seconds
     exponential_base: float = 2
-    jitter: float = 0.1
+    # Deprecated, use jitter_mode; 0 maps to "none", other values are ignored
+    jitter: Optional[float] = None
+    # "full" spreads retries over the whole backoff window, "equal" over its
+    # upper half, "none" retries exactly at the backoff delay
+    jitter_mode: Literal["full", "equal", "none"] = "full"
+    # Errors worth retrying; anything else (e.g. a TypeError from bad
+    # arguments) fails on the first attempt. Timeouts are always retried.
+    retry_on: Tuple[Type[BaseException], ...] = (aiohttp.ClientError, ConnectionError, OSError)
+    # Backoff cap per attempt, filled in from the fields above
+    _schedule: Tuple[float, ...] = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        if self.jitter is not None:
+            warnings.warn(
+                "RetryConfig.jitter is deprecated, use jitter_mode instead",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            if self.jitter <= 0:
+                object.__setattr__(self, "jitter_mode", "none")
+        object.__setattr__(self, "_schedule", tuple(
+            min(self.base_delay * self.exponential_base ** i, self.max_delay)
+            for i in range(self.max_attempts)
+        ))
+
+@dataclass(frozen=True, **_SLOTS)
 class RateLimitConfig:
     requests_per_minute: int = 60
     burst_size: int = 10
     window_size: int = 60  # seconds
 
-@dataclass
+    @property
+    def rate(self) -> float:
+        """Sustained requests allowed per second"""
+        return self.requests_per_minute / self.window_size
+
+@dataclass(frozen=True, **_SLOTS)
 class TimeoutConfig:
     connect: float = 10.0  # seconds
     read: float = 30.0     # seconds
     total: float = 60.0    # seconds
 
+@dataclass(frozen=True, **_SLOTS)
+class CachedResponse:
+    """Status, headers and fully read body of a completed request"""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+    url: str
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """Decode the body as text"""
+        return self.body.decode(encoding)
+
+    def json(self) -> Any:
+        """Parse the body as JSON"""
+        return orjson.loads(self.body)
+
 class RequestHandler:
     """Handles request retries, rate limiting and timeouts"""
     
@@ -39,18 +122,85 @@ class RequestHandler:
         self,
         retry_config: Optional[RetryConfig] = None,
         rate_limit_config: Optional[RateLimitConfig] = None,
-        timeout_config: Optional[TimeoutConfig] = None
+        timeout_config: Optional[TimeoutConfig] = None,
+        http2: bool = False
     ):
         self.retry_config = retry_config or RetryConfig()
         self.rate_limit_config = rate_limit_config or RateLimitConfig()
         self.timeout_config = timeout_config or TimeoutConfig()
+
+        # Timeouts don't change for the handler's lifetime, build them once
+        self._aiohttp_timeout = ClientTimeout(
+            connect=self.timeout_config.connect,
+            sock_read=self.timeout_config.read,
+            total=self.timeout_config.total
+        )
+        self._wait_timeout = self.timeout_config.total
         
-        # Rate limiting state
-        self._request_timestamps = []
-        self._last_request_time = 0.0
-        
-        # Retry state
-        self._retry_counts: Dict[str, int] = {}
+        # Rate limiting state: a token bucket holding up to burst_size
+        # requests, refilled continuously at the configured rate
+        self._tokens: float = float(self.rate_limit_config.burst_size)
+        self._last_refill: float = time.monotonic()
+
+        # Session shared by make_request calls so connections are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Opt-in HTTP/2 client (needs `pip install httpx[http2]`), which
+        # multiplexes concurrent requests to a host over one connection
+        self.http2 = http2
+        self._client = None
+
+        self._retry_on = self.retry_config.retry_on
+        if http2:
+            import httpx
+            # httpx transport errors don't derive from OSError
+            self._retry_on += (httpx.TransportError,)
+
+    async def __aenter__(self) -> "RequestHandler":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use or after close"""
+        # Nothing is awaited between the check and the assignment, so
+        # concurrent requests on the loop can't create two sessions
+        if self._session is None or self._session.closed:
+            # Closing the session leaves the shared connector open
+            self._session = aiohttp.ClientSession(
+                timeout=self._aiohttp_timeout,
+                connector=get_shared_connector(),
+                connector_owner=False
+            )
+        return self._session
+
+    def _get_client(self):
+        """Return the shared httpx HTTP/2 client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            import httpx
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(
+                    self.timeout_config.total,
+                    connect=self.timeout_config.connect,
+                    read=self.timeout_config.read
+                ),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20
+                )
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared session and HTTP/2 client"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     async def execute(
         self,
@@ -63,7 +213,7 @@ class RequestHandler:
         
         retry_key = retry_key or operation.__name__
         attempt = 0
-        last_error = None
+        last_exc = None
         
         while attempt < self.retry_config.max_attempts:
             try:
@@ -73,84 +223,84 @@ class RequestHandler:
                 # Execute with timeout
                 return await asyncio.wait_for(
                     operation(*args, **kwargs),
-                    timeout=self.timeout_config.total
+                    timeout=self._wait_timeout
                 )
                 
-            except asyncio.TimeoutError:
-                last_error = f"Operation timed out after {self.timeout_config.total}s"
-                logger.warning(f"Timeout on attempt {attempt + 1} for {retry_key}")
+            except asyncio.TimeoutError as e:
+                last_exc = e
+                logger.warning("Timeout on attempt %d for %s", attempt + 1, retry_key)
                 
-            except Exception as e:
-                last_error = str(e)
-                logger.warning(f"Error on attempt {attempt + 1} for {retry_key}: {e}")
-            
-            # Update rate limiting state
-            self._update_request_count()
+            except self._retry_on as e:
+                last_exc = e
+                logger.warning("Error on attempt %d for %s: %s", attempt + 1, retry_key, e)
             
             # Calculate retry delay
             delay = self._calculate_retry_delay(attempt)
             
             attempt += 1
             if attempt < self.retry_config.max_attempts:
-                logger.info(f"Retrying {retry_key} in {delay:.2f}s (attempt {attempt + 1})")
+                logger.info("Retrying %s in %.2fs (attempt %d)", retry_key, delay, attempt + 1)
                 await asyncio.sleep(delay)
         
-        raise Exception(f"Operation failed after {attempt} attempts. Last error: {last_error}")
+        raise RetryError(attempt, last_exc) from last_exc
     
     def _calculate_retry_delay(self, attempt: int) -> float:
         """Calculate exponential backoff with jitter"""
-        delay = min(
-            self.retry_config.base_delay * (self.retry_config.exponential_base ** attempt),
-            self.retry_config.max_delay
-        )
+        cap = self.retry_config._schedule[attempt]
         
-        # Add jitter
-        jitter = self.retry_config.jitter * delay * (2 * random.random() - 1)
-        return max(0, delay + jitter)
+        # Randomise within the window so handlers failing together don't
+        # retry in lockstep
+        jitter_mode = self.retry_config.jitter_mode
+        if jitter_mode == "full":
+            return random.uniform(0, cap)
+        if jitter_mode == "equal":
+            return cap / 2 + random.uniform(0, cap / 2)
+        return cap
     
     async def _wait_for_rate_limit(self) -> None:
-        """Wait if rate limit is exceeded"""
-        now = time.time()
-        
-        # Remove old timestamps
-        window_start = now - self.rate_limit_config.window_size
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps
-            if ts > window_start
-        ]
-        
-        # Check if we're over the limit
-        if len(self._request_timestamps) >= self.rate_limit_config.requests_per_minute:
-            # Calculate wait time
-            oldest_timestamp = self._request_timestamps[0]
-            wait_time = self.rate_limit_config.window_size - (now - oldest_timestamp)
-            if wait_time > 0:
-                logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
-    
-    def _update_request_count(self) -> None:
-        """Update rate limiting state"""
-        self._request_timestamps.append(time.time())
+        """Take a token from the rate limit bucket, waiting for one if it is empty"""
+        rate = self.rate_limit_config.rate
+        capacity = float(self.rate_limit_config.burst_size)
+        while True:
+            # Refill and take happen without an await in between, so they
+            # are atomic on the loop and need no lock; only the sleep yields
+            now = time.monotonic()
+            self._tokens = min(capacity, self._tokens + (now - self._last_refill) * rate)
+            self._last_refill = now
+
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+
+            # Other waiters may claim the next token first, so check again
+            # after sleeping rather than assuming it is ours
+            wait_time = (1.0 - self._tokens) / rate
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rate limit reached, waiting %.2fs", wait_time)
+            await asyncio.sleep(wait_time)
         
     async def make_request(
         self,
         url: str,
         method: str = "GET",
         **kwargs
-    ) -> aiohttp.ClientResponse:
+    ) -> CachedResponse:
         """Make HTTP request with retry and rate limiting"""
         
         async def _do_request():
-            timeout = ClientTimeout(
-                connect=self.timeout_config.connect,
-                sock_read=self.timeout_config.read,
-                total=self.timeout_config.total
-            )
-            
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.request(method, url, **kwargs) as response:
-                    await response.read()
-                    return response
+            # Hand back plain data rather than a response tied to a
+            # released connection
+            if self.http2:
+                response = await self._get_client().request(method, url, **kwargs)
+                return CachedResponse(
+                    response.status_code, response.headers, response.content, str(response.url)
+                )
+            session = self._get_session()
+            async with session.request(method, url, **kwargs) as response:
+                body = await response.read()
+                return CachedResponse(
+                    response.status, response.headers, body, str(response.url)
+                )
         
         return await self.execute(
             _do_request,
@@ -161,13 +311,30 @@ class RequestHandler:
 def with_retry(
     retry_config: Optional[RetryConfig] = None,
     rate_limit_config: Optional[RateLimitConfig] = None,
-    timeout_config: Optional[TimeoutConfig] = None
+    timeout_config: Optional[TimeoutConfig] = None,
+    scope: Literal["global", "per_func"] = "global"
 ):
-    handler = RequestHandler(retry_config, rate_limit_config, timeout_config)
+    """
+    Wrap async functions with retry, rate limit and timeout handling
+
+    With scope="global" every function decorated by this decorator shares one
+    rate limit; "per_func" gives each decorated function its own handler.
+    """
+    shared_handler = None
+    if scope == "global":
+        shared_handler = RequestHandler(retry_config, rate_limit_config, timeout_config)
     
     def decorator(func):
+        handler = shared_handler or RequestHandler(
+            retry_config, rate_limit_config, timeout_config
+        )
+        # Resolved once at decoration time rather than on every call;
+        # __qualname__ keeps same-named methods of different classes apart
+        execute = handler.execute
+        retry_key = func.__qualname__
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            return await handler.execute(func, *args, **kwargs)
+            return await execute(func, *args, retry_key=retry_key, **kwargs)
         return wrapper
-    return decorator 
\ No newline at end of file
+    return decorator
@@ -0,0 +1,70 @@
+import json
+from datetime import datetime
+from src.config.proxy_manager import ProxyManager
+
+
+def _write(path, entries):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(entries))
+
+
+class TestProxyManager:
+    def test_managers_share_loaded_list_but_not_selection(self, tmp_path, monkeypatch):
+        """Proxy files are read once, while each manager keeps its own current proxy"""
+        raw_file = tmp_path / "raw_proxies.json"
+        raw_file.write_text(json.dumps([
+            {"ip_address": "10.0.0.1", "port": 8080},
+            {"ip_address": "10.0.0.2", "port": 1080},
+        ]))
+        files = dict(
+            proxy_file=str(tmp_path / "proxies.json"),
+            raw_proxy_file=str(raw_file),
+            working_proxies_file=str(tmp_path / "working_proxies.json"),
+        )
+
+        first = ProxyManager(**files)
+
+        def read_again(*args):
+            raise AssertionError("proxy file read twice")
+
+        monkeypatch.setattr(ProxyManager, "_load_from_file", read_again)
+        second = ProxyManager(**files)
+
+        assert [p.server for p in second.proxies] == ["10.0.0.1:8080", "10.0.0.2:1080"]
+        assert second.proxies is not first.proxies
+        assert second.proxies[0] is not first.proxies[0]
+
+        first.current_proxy = first.proxies[0]
+        assert second.current_proxy is None
+        assert second.get_proxy_config() is None
+
+    def test_files_written_later_are_loaded(self, tmp_path):
+        """A proxy file that appears after the first load is picked up"""
+        files = dict(
+            proxy_file=str(tmp_path / "proxies.json"),
+            raw_proxy_file=str(tmp_path / "raw_proxies.json"),
+            working_proxies_file=str(tmp_path / "working_proxies.json"),
+        )
+        assert ProxyManager(**files).working_proxies == []
+
+        _write(tmp_path / "working_proxies.json", [{
+            "server": "10.0.0.3:3128",
+            "protocol": "http",
+            "last_checked": datetime.now().isoformat(),
+        }])
+
+        assert [p.server for p in ProxyManager(**files).working_proxies] == ["10.0.0.3:3128"]
+
+    def test_relative_paths_follow_working_directory(self, tmp_path, monkeypatch):
+        """Default relative paths in different directories don't share a cache entry"""
+        for name, port in (("a", 8080), ("b", 8888)):
+            _write(tmp_path / name / "config" / "raw_proxies.json",
+                   [{"ip_address": "10.0.0.1", "port": port}])
+
+        monkeypatch.chdir(tmp_path / "a")
+        first = ProxyManager()
+        monkeypatch.chdir(tmp_path / "b")
+        second = ProxyManager()
+
+        assert [p.server for p in first.proxies] == ["10.0.0.1:8080"]
+        assert [p.server for p in second.proxies] == ["10.0.0.1:8888"]
@@ -0,0 +1,71 @@
+import json
+import pytest
+from src.config.spoof_profiles import SpoofingProfiles
+
+
+def _profile(name: str, timezone_id: str = "Asia/Tokyo", sample_rate: int = 48000):
+    return {
+        "name": name,
+        "timezone": {"enabled": True, "timezone_id": timezone_id, "locale": "ja-JP"},
+        "audio": {"enabled": True, "sample_rate": sample_rate, "channel_count": 2},
+    }
+
+
+class TestSpoofingProfiles:
+    @pytest.fixture
+    def profiles_dir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "config").mkdir()
+        return tmp_path
+
+    def test_invalid_profiles_skipped_on_load(self, profiles_dir):
+        """A malformed profile in the file is dropped instead of breaking the pool"""
+        (profiles_dir / "config" / "spoof_profiles.json").write_text(json.dumps({
+            "desktop": [
+                _profile("good"),
+                _profile("bad_tz", timezone_id="Mars/Olympus_Mons"),
+                _profile("bad_audio", sample_rate=-1),
+            ]
+        }))
+
+        profiles = SpoofingProfiles()
+
+        assert [p["name"] for p in profiles.profiles["desktop"]] == ["good"]
+
+    def test_add_profile_validates(self, profiles_dir):
+        """Profiles added at runtime are validated before they can be drawn"""
+        profiles = SpoofingProfiles()
+        count = len(profiles.profiles["desktop"])
+
+        with pytest.raises(ValueError, match="Invalid timezone"):
+            profiles.add_profile("desktop", _profile("bad", timezone_id="Not/AZone"))
+        profiles.add_profile("desktop", _profile("good"))
+
+        assert [p["name"] for p in profiles.profiles["desktop"][count:]] == ["good"]
+
+    def test_profiles_missing_sections_rejected(self, profiles_dir):
+        """Profiles without dict timezone and audio sections are dropped or refused"""
+        no_audio = _profile("no_audio")
+        del no_audio["audio"]
+        bad_timezone = _profile("bad_timezone")
+        bad_timezone["timezone"] = "Asia/Tokyo"
+        (profiles_dir / "config" / "spoof_profiles.json").write_text(json.dumps({
+            "desktop": [_profile("good"), {"name": "nosections"}, no_audio, bad_timezone]
+        }))
+
+        profiles = SpoofingProfiles()
+
+        assert [p["name"] for p in profiles.profiles["desktop"]] == ["good"]
+        with pytest.raises(ValueError, match="timezone section"):
+            profiles.add_profile("desktop", {"name": "nosections"})
+
+    def test_all_invalid_profiles_raise(self, profiles_dir):
+        """A file with no usable profile fails clearly instead of leaving an empty pool"""
+        profiles_file = profiles_dir / "config" / "spoof_profiles.json"
+        profiles_file.write_text(json.dumps({
+            "desktop": [_profile("bad_tz", timezone_id="Mars/Olympus")]
+        }))
+
+        with pytest.raises(ValueError, match="No valid spoofing profiles in .*spoof_profiles.json"):
+            SpoofingProfiles()
+        assert "Mars/Olympus" in profiles_file.read_text()
@@ -25,3 +25,72 @@ class TestAnonymousBrowser:
             assert browser.page is not None
         finally:
             await browser.close()
+
+
+class _FakeContext:
+    def __init__(self):
+        self.bindings = {}
+
+    async def expose_binding(self, name, callback):
+        assert name not in self.bindings, "binding exposed twice"
+        self.bindings[name] = callback
+
+
+class _FakePage:
+    def __init__(self):
+        self.scripts = []
+
+    async def evaluate(self, script, *args):
+        self.scripts.append(script)
+        return False
+
+
+def _fake_fingerprint():
+    from types import SimpleNamespace
+    return SimpleNamespace(
+        navigator=SimpleNamespace(
+            userAgent="Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0",
+            platform="Linux x86_64",
+            hardwareConcurrency=8,
+            deviceMemory=8,
+            language="en-US",
+            languages=["en-US", "en"],
+        ),
+        screen=SimpleNamespace(
+            width=1920, height=1080, devicePixelRatio=1, colorDepth=24
+        ),
+    )
+
+
+class TestConfigDisplay:
+    @pytest.mark.asyncio
+    async def test_inject_exposes_random_binding_after_display(self):
+        """Config binding is exposed once, under a per-browser name, after injection"""
+        browser = AnonymousBrowser()
+        browser.context = _FakeContext()
+        browser.page = _FakePage()
+        browser.fingerprint = _fake_fingerprint()
+
+        assert not browser.context.bindings
+        await browser.inject_config_display()
+        await browser.inject_config_display()
+
+        assert list(browser.context.bindings) == [browser._config_binding]
+        assert "anonGetConfig" not in browser.page.scripts[0]
+        assert f'"{browser._config_binding}"' in browser.page.scripts[0]
+
+        config = browser.context.bindings[browser._config_binding]({})
+        assert config["compact"]["os"] == "Linux"
+        assert config["detailed"]["Screen"]["Resolution"] == "1920x1080"
+
+    @pytest.mark.asyncio
+    async def test_inject_without_fingerprint_skips_binding(self):
+        """Nothing is injected or exposed before a fingerprint exists"""
+        browser = AnonymousBrowser()
+        browser.context = _FakeContext()
+        browser.page = _FakePage()
+
+        await browser.inject_config_display()
+
+        assert not browser.page.scripts
+        assert not browser.context.bindings
@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from src.core.browser_pool import BrowserPool
+
+
+class _FakeContext:
+    async def close(self):
+        # Yield long enough for the pool's background fill to run
+        await asyncio.sleep(0.01)
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.contexts = [_FakeContext()]
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+def _fake_pool(size: int) -> BrowserPool:
+    async def launch(headless=False):
+        await asyncio.sleep(0)
+        return _FakeBrowser()
+
+    pool = BrowserPool(size=size)
+    async def stop():
+        pass
+
+    pool.playwright = SimpleNamespace(firefox=SimpleNamespace(launch=launch), stop=stop)
+    return pool
+
+
+class TestBrowserPool:
+    @pytest.mark.asyncio
+    async def test_acquire_uses_prelaunched_browser(self):
+        """Acquire hands out a browser the background fill launched"""
+        pool = _fake_pool(size=1)
+        await pool.start()
+        await pool._filler
+        prelaunched = pool._idle.get_nowait()
+        pool._idle.put_nowait(prelaunched)
+
+        assert await pool.acquire() is prelaunched
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_release_when_fill_takes_slot(self):
+        """A fill racing a release closes the surplus browser instead of raising"""
+        pool = _fake_pool(size=1)
+        browser = await pool.acquire()
+
+        await pool.release(browser)
+        await pool._filler
+
+        assert browser.closed
+        assert pool._idle.qsize() == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_release_closes_disconnected_browser(self):
+        """Disconnected browsers are closed rather than pooled"""
+        pool = _fake_pool(size=1)
+        browser = _FakeBrowser()
+        browser.closed = True
+
+        await pool.release(browser)
+
+        assert browser.closed
+        assert pool._idle.empty()
@@ -0,0 +1,63 @@
+import pytest
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+from src.core.network_handler import NetworkRequestHandler, _netloc
+
+
+@pytest.fixture
+def handler():
+    # Any object will do, proxies aren't touched by these tests
+    return NetworkRequestHandler(proxy_manager=SimpleNamespace())
+
+
+def _apply(handler, url):
+    return handler._apply_request_filters(SimpleNamespace(url=url))
+
+
+class TestNetloc:
+    @pytest.mark.parametrize("url", [
+        "https://example.com",
+        "https://example.com/path?q=1#frag",
+        "http://user:pw@example.com:8080/p",
+        "http://example.com?query",
+        "http://example.com#frag",
+        "file:///tmp/page.html",
+        "about:blank",
+        "data:text/plain,https://example.com/",
+        "blob:https://example.com/0b1c",
+        "",
+    ])
+    def test_matches_urlparse(self, url):
+        """_netloc agrees with urlparse on the URLs the browser hands us"""
+        assert _netloc(url) == urlparse(url).netloc
+
+
+class TestRequestFilters:
+    def test_first_matching_filter_wins(self, handler):
+        """The combined alternation picks the first added filter that matches"""
+        handler.add_request_filter(r".*api.*", lambda request: "api")
+        handler.add_request_filter(r".*example\.com.*", lambda request: "example")
+
+        assert _apply(handler, "https://api.example.com/v1") == "api"
+        assert _apply(handler, "https://www.example.com/") == "example"
+        assert _apply(handler, "https://other.org/") is None
+        assert handler._compiled_filters[1] is not None
+
+    def test_patterns_with_groups_matched_separately(self, handler):
+        """Patterns with groups skip the alternation but still match in order"""
+        handler.add_request_filter(r"https://(\w+)\.\1\.test/.*", lambda request: "repeat")
+        handler.add_request_filter(r".*", lambda request: "any")
+
+        assert handler._compiled_filters is None
+        assert _apply(handler, "https://ab.ab.test/x") == "repeat"
+        assert _apply(handler, "https://ab.cd.test/x") == "any"
+        assert handler._compiled_filters[1] is None
+
+    def test_adding_filter_recompiles(self, handler):
+        """Filters added after a match are picked up"""
+        handler.add_request_filter(r".*a\.test.*", lambda request: "a")
+        assert _apply(handler, "https://b.test/") is None
+
+        handler.add_request_filter(r".*b\.test.*", lambda request: "b")
+        assert _apply(handler, "https://b.test/") == "b"
@@ -0,0 +1,21 @@
+from src.utils.js_minifier import minify_js
+
+
+class TestMinifyJs:
+    def test_strips_indentation_blank_lines_and_comments(self):
+        """Whole-line comments and blank lines go, code lines are dedented"""
+        source = """
+            // leading comment
+            const a = 1;
+
+                // indented comment
+            function f() {
+                return a;
+            }
+        """
+        assert minify_js(source) == "const a = 1;\nfunction f() {\nreturn a;\n}"
+
+    def test_keeps_line_breaks_and_inline_content(self):
+        """Line breaks survive for ASI, and // inside a line is left alone"""
+        source = "const u = 'https://example.com'\nconst b = u"
+        assert minify_js(source) == source
@@ -0,0 +1,162 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from src.utils import request_handler
+from src.utils.request_handler import (
+    RateLimitConfig,
+    RequestHandler,
+    RetryConfig,
+    RetryError,
+    TimeoutConfig,
+)
+
+_real_sleep = asyncio.sleep
+
+
+class _FakeClock:
+    """Monotonic clock that only moves when the rate limiter sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(request_handler, "time", clock)
+    monkeypatch.setattr(request_handler, "asyncio", SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def _retry_handler(**retry) -> RequestHandler:
+    return RequestHandler(
+        retry_config=RetryConfig(base_delay=0, jitter_mode="none", **retry),
+        timeout_config=TimeoutConfig(total=0.05),
+    )
+
+
+class TestRateLimit:
+    @pytest.mark.asyncio
+    async def test_burst_admitted_without_waiting(self, clock):
+        """Up to burst_size requests go through at once"""
+        handler = RequestHandler(rate_limit_config=RateLimitConfig(requests_per_minute=60, burst_size=3))
+
+        for _ in range(3):
+            await handler._wait_for_rate_limit()
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_refill_after_burst(self, clock):
+        """Once the bucket is empty, tokens come back at the configured rate"""
+        handler = RequestHandler(rate_limit_config=RateLimitConfig(requests_per_minute=60, burst_size=2))
+        for _ in range(2):
+            await handler._wait_for_rate_limit()
+
+        await handler._wait_for_rate_limit()
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+        clock.now += 2.0
+        await handler._wait_for_rate_limit()
+        await handler._wait_for_rate_limit()
+        assert len(clock.sleeps) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_never_exceed_rate(self, clock):
+        """Waiters re-check the bucket after sleeping, so none takes a token twice"""
+        handler = RequestHandler(rate_limit_config=RateLimitConfig(requests_per_minute=60, burst_size=2))
+        admitted = []
+
+        async def caller():
+            await handler._wait_for_rate_limit()
+            admitted.append(clock.now)
+
+        await asyncio.gather(*(caller() for _ in range(8)))
+
+        assert len(admitted) == 8
+        for count, at in enumerate(sorted(admitted), start=1):
+            # burst_size up front, then one per second
+            assert at >= (count - 2) * 1.0 - 1e-9
+
+
+class TestRetry:
+    @pytest.mark.asyncio
+    async def test_retry_error_chained_to_last_failure(self):
+        """Exhausted retries raise RetryError caused by the last exception"""
+        handler = _retry_handler(max_attempts=3)
+        errors = []
+
+        async def operation():
+            errors.append(ConnectionError(f"attempt {len(errors) + 1}"))
+            raise errors[-1]
+
+        with pytest.raises(RetryError) as info:
+            await handler.execute(operation)
+
+        assert info.value.attempts == 3
+        assert info.value.last_exc is errors[-1]
+        assert info.value.__cause__ is errors[-1]
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_retried(self):
+        """Operations that time out are retried and reported as the cause"""
+        handler = _retry_handler(max_attempts=2)
+        calls = []
+
+        async def operation():
+            calls.append(1)
+            await asyncio.sleep(1)
+
+        with pytest.raises(RetryError) as info:
+            await handler.execute(operation)
+
+        assert len(calls) == 2
+        assert isinstance(info.value.__cause__, asyncio.TimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_non_transient_error_not_retried(self):
+        """Errors outside retry_on propagate on the first attempt"""
+        handler = _retry_handler(max_attempts=3)
+        calls = []
+
+        async def operation():
+            calls.append(1)
+            raise TypeError("bad argument")
+
+        with pytest.raises(TypeError):
+            await handler.execute(operation)
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_on_is_configurable(self):
+        """Custom retry_on errors are retried until the operation succeeds"""
+        handler = _retry_handler(max_attempts=3, retry_on=(KeyError,))
+        calls = []
+
+        async def operation():
+            calls.append(1)
+            if len(calls) < 3:
+                raise KeyError("missing")
+            return "ok"
+
+        assert await handler.execute(operation) == "ok"
+        assert len(calls) == 3
+
+    def test_backoff_schedule_capped(self):
+        """Backoff caps grow exponentially up to max_delay"""
+        config = RetryConfig(max_attempts=5, base_delay=1.0, max_delay=5.0, jitter_mode="none")
+
+        handler = RequestHandler(retry_config=config)
+
+        assert [handler._calculate_retry_delay(i) for i in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]